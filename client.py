@@ -10,13 +10,18 @@ Usage:
 """
 
 import argparse
-import socket
 import logging
+import os
+import random
+import selectors
 import socket
 import sys
-import time
 from typing import Optional
 
+from sunshine_mmlock.protocol import (
+    receive_monitor_switch_fd, receive_monitor_switch_into, configure_socket, DEFAULT_PORT
+)
+
 # Try to import pynput for cross-platform keyboard support
 try:
     from pynput import keyboard
@@ -25,150 +30,27 @@ except ImportError:
     PYNPUT_AVAILABLE = False
     print("WARNING: pynput not available. Install with: pip install pynput")
 
-logger = logging.getLogger(__name__)
-
-from sunshine_mmlock.protocol import receive_monitor_switch, DEFAULT_PORT
-"""
-Network protocol for monitor switch notifications.
-
-Simple TCP-based protocol where:
-- Server sends a single byte (0-10) representing the monitor ID
-- Client receives and triggers the corresponding keystroke
-- Connection is persistent with reconnection logic
-"""
-
-import socket
-import struct
-import logging
-
-logger = logging.getLogger(__name__)
-
-
-# Protocol constants
-PROTOCOL_VERSION = 1
-DEFAULT_PORT = 9876
-MAX_MONITOR_ID = 10  # Support F1-F11
-
-
-class MonitorProtocol:
-    """Handles encoding/decoding of monitor switch messages."""
-    
-    @staticmethod
-    def encode_monitor_switch(monitor_id: int) -> bytes:
-        """Encode a monitor ID into a network message.
-        
-        Args:
-            monitor_id: Monitor index (0-10)
-            
-        Returns:
-            Bytes ready to send over the network
-        """
-        if not (0 <= monitor_id <= MAX_MONITOR_ID):
-            raise ValueError(f"Monitor ID must be 0-{MAX_MONITOR_ID}, got {monitor_id}")
-        
-        # Simple protocol: single byte for monitor ID
-        return struct.pack('B', monitor_id)
-    
-    @staticmethod
-    def decode_monitor_switch(data: bytes) -> int:
-        """Decode a monitor switch message.
-        
-        Args:
-            data: Raw bytes from network
-            
-        Returns:
-            Monitor ID (0-10)
-        """
-        if len(data) != 1:
-            raise ValueError(f"Expected 1 byte, got {len(data)}")
-        
-        monitor_id = struct.unpack('B', data)[0]
-        
-        if not (0 <= monitor_id <= MAX_MONITOR_ID):
-            raise ValueError(f"Invalid monitor ID: {monitor_id}")
-        
-        return monitor_id
-
-
-def send_monitor_switch(sock: socket.socket, monitor_id: int) -> bool:
-    """Send a monitor switch notification over a socket.
-    
-    Args:
-        sock: Connected socket
-        monitor_id: Monitor ID to send
-        
-    Returns:
-        True if successful, False if connection error
-    """
-    try:
-        message = MonitorProtocol.encode_monitor_switch(monitor_id)
-        sock.sendall(message)
-        logger.debug("Sent monitor ID %d", monitor_id)
-        return True
-    except (socket.error, OSError) as e:
-        logger.error("Failed to send monitor switch: %s", e)
-        return False
-
-
-def receive_monitor_switch(sock: socket.socket, timeout: float = None) -> int:
-    """Receive a monitor switch notification from a socket.
-    
-    Args:
-        sock: Connected socket
-        timeout: Optional timeout in seconds
-        
-    Returns:
-        Monitor ID (0-10)
-        
-    Raises:
-        ConnectionError: If connection is closed
-        ValueError: If invalid data received
-    """
-    if timeout is not None:
-        sock.settimeout(timeout)
+# Map modifier names and monitor IDs to pynput keys
+if PYNPUT_AVAILABLE:
+    MODIFIER_MAP = {
+        'ctrl': keyboard.Key.ctrl,
+        'control': keyboard.Key.ctrl,
+        'alt': keyboard.Key.alt,
+        'option': keyboard.Key.alt,
+        'shift': keyboard.Key.shift,
+        'cmd': keyboard.Key.cmd,
+        'command': keyboard.Key.cmd,
+        'super': keyboard.Key.cmd,
+    }
     
-    try:
-        data = sock.recv(1)
-        if not data:
-            raise ConnectionError("Connection closed by peer")
-        
-        monitor_id = MonitorProtocol.decode_monitor_switch(data)
-        logger.debug("Received monitor ID %d", monitor_id)
-        return monitor_id
-    except socket.timeout:
-        raise TimeoutError("Receive timeout")
-    except (socket.error, OSError) as e:
-        raise ConnectionError(f"Socket error: {e}")
+    # Monitor ID to function key (0->F1, 1->F2, ..., 10->F11)
+    _FUNCTION_KEYS = (
+        keyboard.Key.f1, keyboard.Key.f2, keyboard.Key.f3, keyboard.Key.f4,
+        keyboard.Key.f5, keyboard.Key.f6, keyboard.Key.f7, keyboard.Key.f8,
+        keyboard.Key.f9, keyboard.Key.f10, keyboard.Key.f11
+    )
 
-def receive_monitor_switch(sock: socket.socket, timeout: float = None) -> int:
-    """Receive a monitor switch notification from a socket.
-    
-    Args:
-        sock: Connected socket
-        timeout: Optional timeout in seconds
-        
-    Returns:
-        Monitor ID (0-10)
-        
-    Raises:
-        ConnectionError: If connection is closed
-        ValueError: If invalid data received
-    """
-    if timeout is not None:
-        sock.settimeout(timeout)
-    
-    try:
-        data = sock.recv(1)
-        if not data:
-            raise ConnectionError("Connection closed by peer")
-        
-        monitor_id = MonitorProtocol.decode_monitor_switch(data)
-        logger.debug("Received monitor ID %d", monitor_id)
-        return monitor_id
-    except socket.timeout:
-        raise TimeoutError("Receive timeout")
-    except (socket.error, OSError) as e:
-        raise ConnectionError(f"Socket error: {e}")
+logger = logging.getLogger(__name__)
 
 
 class KeystrokeClient:
@@ -180,8 +62,6 @@ class KeystrokeClient:
         Args:
             modifiers: List of modifier keys (default: ['ctrl', 'alt', 'shift', 'cmd'])
         """
-        self.logger = logging.getLogger(__name__)
-        
         if not PYNPUT_AVAILABLE:
             raise RuntimeError("pynput is required for keystroke client. Install with: pip install pynput")
         
@@ -192,20 +72,9 @@ class KeystrokeClient:
         if modifiers is None:
             modifiers = ['ctrl', 'alt', 'shift', 'cmd']
         
-        # Map modifier names to pynput keys
-        MODIFIER_MAP = {
-            'ctrl': keyboard.Key.ctrl,
-            'control': keyboard.Key.ctrl,
-            'alt': keyboard.Key.alt,
-            'option': keyboard.Key.alt,
-            'shift': keyboard.Key.shift,
-            'cmd': keyboard.Key.cmd,
-            'command': keyboard.Key.cmd,
-            'super': keyboard.Key.cmd,
-        }
-        
-        self._modifiers = [MODIFIER_MAP[mod.lower()] for mod in modifiers if mod.lower() in MODIFIER_MAP]
-        self.logger.info("Initialized keystroke client with modifiers: %s", modifiers)
+        self._modifiers = tuple(MODIFIER_MAP[mod.lower()] for mod in modifiers if mod.lower() in MODIFIER_MAP)
+        self._modifier_names = '+'.join(str(mod).split('.')[-1] for mod in self._modifiers)
+        logger.info("Initialized keystroke client with modifiers: %s", modifiers)
     
     def press_hotkey(self, monitor_id: int):
         """Press the hotkey combination for the given monitor.
@@ -213,56 +82,55 @@ class KeystrokeClient:
         Args:
             monitor_id: Monitor ID (0-10) corresponding to F1-F11
         """
-        # Map monitor ID to function key (0->F1, 1->F2, ..., 10->F11)
-        function_keys = [
-            keyboard.Key.f1, keyboard.Key.f2, keyboard.Key.f3, keyboard.Key.f4,
-            keyboard.Key.f5, keyboard.Key.f6, keyboard.Key.f7, keyboard.Key.f8,
-            keyboard.Key.f9, keyboard.Key.f10, keyboard.Key.f11
-        ]
-        
-        if not (0 <= monitor_id <= 10):
-            self.logger.error("Invalid monitor ID: %d", monitor_id)
+        if not (0 <= monitor_id < len(_FUNCTION_KEYS)):
+            logger.error("Invalid monitor ID: %d", monitor_id)
             return
         
-        target_key = function_keys[monitor_id]
-        
         try:
-            # Press all modifiers
-            for mod in self._modifiers:
-                self._keyboard.press(mod)
-            
-            # Tap the function key
-            self._keyboard.tap(target_key)
-            
-            # Release all modifiers
-            for mod in reversed(self._modifiers):
-                self._keyboard.release(mod)
+            # Hold all modifiers while tapping the function key
+            with self._keyboard.pressed(*self._modifiers):
+                self._keyboard.tap(_FUNCTION_KEYS[monitor_id])
             
-            modifier_names = '+'.join([str(mod).split('.')[-1] for mod in self._modifiers])
-            self.logger.info("Pressed hotkey for monitor ID %d: %s+F%d", 
-                           monitor_id, modifier_names, monitor_id + 1)
+            logger.info("Pressed hotkey for monitor ID %d: %s+F%d", 
+                        monitor_id, self._modifier_names, monitor_id + 1)
         except Exception as e:
-            self.logger.error("Failed to press hotkey: %s", e, exc_info=True)
+            logger.error("Failed to press hotkey: %s", e, exc_info=True)
 
 
 class MonitorClient:
     """Network client that connects to monitor server and handles monitor switches."""
     
-    def __init__(self, host: str, port: int = DEFAULT_PORT, reconnect_delay: float = 5.0):
+    def __init__(self, host: str, port: int = DEFAULT_PORT, reconnect_delay: float = 5.0,
+                 connect_timeout: float = 5.0, max_reconnect_delay: float = 60.0):
         """Initialize the monitor client.
         
         Args:
             host: Server hostname or IP
             port: Server port
-            reconnect_delay: Seconds to wait between reconnection attempts
+            reconnect_delay: Initial seconds to wait between reconnection attempts
+            connect_timeout: Seconds to wait for name resolution and connect
+            max_reconnect_delay: Upper bound for the exponential reconnect backoff
         """
         self.host = host
         self.port = port
         self.reconnect_delay = reconnect_delay
-        self.logger = logging.getLogger(__name__)
+        self.connect_timeout = connect_timeout
+        self.max_reconnect_delay = max_reconnect_delay
+        self._backoff = reconnect_delay
         self._socket: Optional[socket.socket] = None
+        self._fd: Optional[int] = None
+        self._recv_buf = bytearray(1)
+        self._debug = logger.isEnabledFor(logging.DEBUG)
         self._running = False
         self.keystroke_client = KeystrokeClient()
+        
+        # Wait for server data and stop requests with a single selector.
+        # stop() writes to the wakeup socket pair to interrupt select().
+        self._selector = selectors.DefaultSelector()
+        self._wakeup_r, self._wakeup_w = socket.socketpair()
+        self._wakeup_r.setblocking(False)
+        self._wakeup_w.setblocking(False)
+        self._selector.register(self._wakeup_r, selectors.EVENT_READ)
     
     def connect(self) -> bool:
         """Connect to the server.
@@ -271,51 +139,108 @@ class MonitorClient:
             True if connected successfully
         """
         try:
-            self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self._socket.connect((self.host, self.port))
-            self.logger.info("Connected to server %s:%d", self.host, self.port)
+            # Tries every address getaddrinfo returns (IPv4 and IPv6)
+            self._socket = socket.create_connection((self.host, self.port),
+                                                    timeout=self.connect_timeout)
+            # Back to blocking mode; reads are gated by the selector
+            self._socket.settimeout(None)
+            configure_socket(self._socket)
+            # Read straight from the descriptor where sockets are plain fds
+            self._fd = self._socket.fileno() if os.name == 'posix' else None
+            self._selector.register(self._socket, selectors.EVENT_READ)
+            # Re-check once per connection rather than once per message
+            self._debug = logger.isEnabledFor(logging.DEBUG)
+            logger.info("Connected to server %s:%d", self.host, self.port)
+            self._backoff = self.reconnect_delay
             return True
         except (socket.error, OSError) as e:
-            self.logger.error("Connection failed: %s", e)
-            if self._socket:
-                self._socket.close()
-                self._socket = None
+            logger.error("Connection failed: %s", e)
+            self._close_socket()
             return False
     
+    def _close_socket(self):
+        """Unregister and close the server connection, if any."""
+        if self._socket:
+            try:
+                self._selector.unregister(self._socket)
+            except (KeyError, ValueError):
+                pass
+            self._socket.close()
+            self._socket = None
+            self._fd = None
+    
+    def _wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the server socket is readable or stop() is called.
+        
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+            
+        Returns:
+            True if the server socket has data, False otherwise
+        """
+        readable = False
+        for key, _ in self._selector.select(timeout):
+            if key.fileobj is self._wakeup_r:
+                try:
+                    self._wakeup_r.recv(64)
+                except BlockingIOError:
+                    pass
+            else:
+                readable = True
+        return readable and self._running
+    
+    def _wait_before_reconnect(self):
+        """Sleep before the next connection attempt using jittered exponential backoff.
+        
+        The delay doubles after every failed attempt up to max_reconnect_delay
+        and is reset once a connection succeeds. A +/-20% jitter keeps many
+        clients from reconnecting in lockstep after a server restart.
+        """
+        delay = self._backoff * random.uniform(0.8, 1.2)
+        logger.info("Reconnecting in %.1f seconds...", delay)
+        self._wait(delay)
+        self._backoff = min(self._backoff * 2, self.max_reconnect_delay)
+    
     def run(self):
         """Main client loop - connect and handle monitor switches."""
         self._running = True
-        self.logger.info("Starting monitor client...")
+        logger.info("Starting monitor client...")
         
-        while self._running:
-            # Connect if not connected
-            if not self._socket:
-                if not self.connect():
-                    self.logger.info("Reconnecting in %.1f seconds...", self.reconnect_delay)
-                    time.sleep(self.reconnect_delay)
+        try:
+            while self._running:
+                # Connect if not connected
+                if not self._socket:
+                    if not self.connect():
+                        self._wait_before_reconnect()
+                        continue
+                
+                if not self._wait():
                     continue
-            
-            # Receive and handle monitor switches
-            try:
-                monitor_id = receive_monitor_switch(self._socket, timeout=1.0)
-                self.keystroke_client.press_hotkey(monitor_id)
-            except TimeoutError:
-                # Timeout is normal, just continue
-                continue
-            except (ConnectionError, ValueError) as e:
-                self.logger.error("Connection error: %s", e)
-                if self._socket:
-                    self._socket.close()
-                    self._socket = None
-                time.sleep(self.reconnect_delay)
+                
+                # Receive and handle monitor switches
+                try:
+                    if self._fd is not None:
+                        monitor_id = receive_monitor_switch_fd(self._fd)
+                    else:
+                        monitor_id = receive_monitor_switch_into(self._socket, self._recv_buf)
+                    if self._debug:
+                        logger.debug("Received monitor ID %d", monitor_id)
+                    self.keystroke_client.press_hotkey(monitor_id)
+                except (ConnectionError, ValueError) as e:
+                    logger.error("Connection error: %s", e)
+                    self._close_socket()
+                    self._wait_before_reconnect()
+        finally:
+            self._close_socket()
     
     def stop(self):
         """Stop the client."""
-        self.logger.info("Stopping client...")
+        logger.info("Stopping client...")
         self._running = False
-        if self._socket:
-            self._socket.close()
-            self._socket = None
+        try:
+            self._wakeup_w.send(b'\0')
+        except OSError:
+            pass
 
 
 def main():
@@ -12,9 +12,11 @@ Usage:
     sunmonlok --help             # Show help
 """
 
+# Only lightweight stdlib imports here. The server and client modules (and
+# their pynput/evdev/Hyprland dependencies) are imported inside the selected
+# mode's branch so that --help and argument errors return quickly.
 import sys
 import argparse
-import subprocess
 
 def main():
     parser = argparse.ArgumentParser(
@@ -48,24 +50,25 @@ Examples:
     try:
         if args.mode == 'server':
             print("🖥️  Starting SunMonLok Server...")
-            # Run the server module
-            subprocess.run([sys.executable, '-m', 'sunshine_mmlock'], check=True)
+            # Run the server in this process
+            from sunshine_mmlock.__main__ import main as server_main
+            server_main()
             
         elif args.mode == 'client':
             print(f"🖱️  Starting SunMonLok Client (connecting to {args.host}:{args.port})...")
-            # Run the client script
-            client_args = [sys.executable, 'client.py', '--host', args.host, '--port', str(args.port)]
-            subprocess.run(client_args, check=True)
+            # Run the client in this process with its own argument list
+            import client
+            sys.argv = ['client.py', '--host', args.host, '--port', str(args.port)]
+            return client.main()
             
     except KeyboardInterrupt:
         print("\n👋 Shutting down...")
         return 0
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Error: Command failed with exit code {e.returncode}")
-        return e.returncode
     except Exception as e:
         print(f"❌ Unexpected error: {e}")
         return 1
+    
+    return 0
 
 if __name__ == '__main__':
     sys.exit(main())
\ No newline at end of file
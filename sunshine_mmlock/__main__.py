@@ -3,11 +3,11 @@ import sys
 import logging
 from .listener import MousePoller
 from .server import MonitorServer
-from .config import config
+from .config import get_config
 
 def setup_logging():
     """Configures the root logger."""
-    level = logging.DEBUG if config.debug else logging.INFO
+    level = logging.DEBUG if get_config().debug else logging.INFO
     logging.basicConfig(
         level=level,
         format='%(asctime)s - %(levelname)s - %(message)s',
@@ -45,29 +45,36 @@ def main():
 
     try:
         # Get server configuration
-        server_port = config.__dict__.get('server_port', 9876)
-        server_bind = config.__dict__.get('server_bind', '0.0.0.0')
+        config = get_config()
+        server_port = config.server_port
+        server_bind = config.server_bind
         
-        # Initialize Sunshine monitor mapping
-        logging.info("Initializing Sunshine monitor mapping...")
-        from .mapper import initialize_sunshine_mapping
-        sunshine_available = initialize_sunshine_mapping()
-        
-        if not sunshine_available:
-            logging.warning("Sunshine mapping not available, falling back to position-based mapping")
-        
-        # Log monitor layout
-        try:
-            from .hyprland_monitor import get_hyprland_monitors
-            monitors = get_hyprland_monitors()
-            logging.info("Detected %d Hyprland monitor(s):", len(monitors))
-            for monitor in monitors:
-                x_end = monitor.x + monitor.effective_width
-                logging.info("  %s (ID=%d) x=[%d-%d) scale=%.2f", 
-                           monitor.name, monitor.id, 
-                           monitor.x, x_end, monitor.scale)
-        except Exception as e:
-            logging.warning("Could not log monitor layout: %s", e)
+        # Sunshine mapping and the layout log both need Sunshine logs and
+        # hyprctl; skip them entirely on hosts where they are disabled.
+        sunshine_available = False
+        if config.enable_sunshine_mapping:
+            # Initialize Sunshine monitor mapping
+            logging.info("Initializing Sunshine monitor mapping...")
+            from .mapper import initialize_sunshine_mapping
+            sunshine_available = initialize_sunshine_mapping()
+            
+            if not sunshine_available:
+                logging.warning("Sunshine mapping not available, falling back to position-based mapping")
+            
+            # Log monitor layout
+            try:
+                from .hyprland_monitor import get_hyprland_monitors
+                monitors = get_hyprland_monitors()
+                logging.info("Detected %d Hyprland monitor(s):", len(monitors))
+                for monitor in monitors:
+                    x_end = monitor.x + monitor.effective_width
+                    logging.info("  %s (ID=%d) x=[%d-%d) scale=%.2f", 
+                               monitor.name, monitor.id, 
+                               monitor.x, x_end, monitor.scale)
+            except Exception as e:
+                logging.warning("Could not log monitor layout: %s", e)
+        else:
+            logging.info("Sunshine mapping disabled in config, using position-based mapping")
         
         # Start network server
         server = MonitorServer(port=server_port, bind_address=server_bind)
@@ -1,4 +1,6 @@
+import functools
 import json
+from dataclasses import dataclass, field
 from typing import List, Dict, Any
 import os
 import logging
@@ -12,31 +14,31 @@ CONFIG_PATH = os.environ.get("MONITOR_MOUSE_LOCK_CONFIG", DEFAULT_CONFIG_PATH)
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
 class Config:
-    """A simple class to hold application configuration."""
-    def __init__(self, config_data: Dict[str, Any]):
-        self.hotkey_modifiers: List[str] = config_data.get("hotkey", {}).get("modifiers", [])
-        self.hotkey_base_keys: List[str] = config_data.get("hotkey", {}).get("base_keys", [])
-        # Polling interval (seconds) for the mouse poller. Separate from debounce.
-        self.poll_interval: float = float(config_data.get("poll_interval", config_data.get("debounce_seconds", 0.2)))
-        self.debounce_seconds: float = float(config_data.get("debounce_seconds", 0.5))
-        # Minimum mouse movement (in pixels) to consider as a change event.
-        # If the mouse hasn't moved beyond this threshold, monitor checks are skipped.
-        self.poll_move_threshold: float = float(config_data.get("poll_move_threshold", 1.0))
-
-        # Debug logging flag
-        self.debug: bool = bool(config_data.get("debug", False))
-
-        # Preferred backend order; supports 'evdev_uinput', 'pynput', 'simulate'
-        self.preferred_backends: List[str] = config_data.get(
-            "preferred_backends",
-            ["evdev_uinput", "pynput", "simulate"]
-        )[:]
-        
-        # Server configuration
-        self.server_port: int = int(config_data.get("server_port", 9876))
-        self.server_bind: str = str(config_data.get("server_bind", "0.0.0.0"))
+    """Immutable application configuration, validated on construction."""
+    hotkey_modifiers: List[str] = field(default_factory=list)
+    hotkey_base_keys: List[str] = field(default_factory=list)
+    # Polling interval (seconds) for the mouse poller. Separate from debounce.
+    poll_interval: float = 0.2
+    debounce_seconds: float = 0.5
+    # Minimum mouse movement (in pixels) to consider as a change event.
+    # If the mouse hasn't moved beyond this threshold, monitor checks are skipped.
+    poll_move_threshold: float = 1.0
+    # Debug logging flag
+    debug: bool = False
+    # Preferred backend order; supports 'evdev_uinput', 'pynput', 'simulate'
+    preferred_backends: List[str] = field(
+        default_factory=lambda: ["evdev_uinput", "pynput", "simulate"]
+    )
+    # Server configuration
+    server_port: int = 9876
+    server_bind: str = "0.0.0.0"
+    # Parse Sunshine logs and query Hyprland at startup for monitor ordering.
+    # Disable on hosts without Sunshine/Hyprland to use position-based mapping.
+    enable_sunshine_mapping: bool = True
 
+    def __post_init__(self):
         # Basic validation
         if not isinstance(self.hotkey_base_keys, list) or len(self.hotkey_base_keys) == 0:
             raise ValueError("config.hotkey.base_keys must be a non-empty list of key names (e.g. ['f1','f2'])")
@@ -45,6 +47,32 @@ class Config:
         if not (1 <= self.server_port <= 65535):
             raise ValueError("config.server_port must be between 1 and 65535")
 
+    @classmethod
+    def from_dict(cls, config_data: Dict[str, Any]) -> "Config":
+        """
+        Builds a Config from parsed config.json data in a single pass.
+
+        Args:
+            config_data: The decoded JSON object.
+
+        Returns:
+            A validated Config object.
+        """
+        hotkey = config_data.get("hotkey") or {}
+        debounce_seconds = config_data.get("debounce_seconds")
+        return cls(
+            hotkey_modifiers=hotkey.get("modifiers", []),
+            hotkey_base_keys=hotkey.get("base_keys", []),
+            poll_interval=float(config_data.get("poll_interval", 0.2 if debounce_seconds is None else debounce_seconds)),
+            debounce_seconds=float(0.5 if debounce_seconds is None else debounce_seconds),
+            poll_move_threshold=float(config_data.get("poll_move_threshold", 1.0)),
+            debug=bool(config_data.get("debug", False)),
+            preferred_backends=list(config_data.get("preferred_backends", ["evdev_uinput", "pynput", "simulate"])),
+            server_port=int(config_data.get("server_port", 9876)),
+            server_bind=str(config_data.get("server_bind", "0.0.0.0")),
+            enable_sunshine_mapping=bool(config_data.get("enable_sunshine_mapping", True)),
+        )
+
 def load_config(path: str = CONFIG_PATH) -> Config:
     """
     Loads and parses the JSON configuration file.
@@ -58,7 +86,7 @@ def load_config(path: str = CONFIG_PATH) -> Config:
     try:
         with open(path, 'r') as f:
             data = json.load(f)
-        return Config(data)
+        return Config.from_dict(data)
     except FileNotFoundError:
         logger.error("Configuration file not found at '%s'. Please ensure it exists.", path)
         raise
@@ -66,22 +94,30 @@ def load_config(path: str = CONFIG_PATH) -> Config:
         logger.error("Could not decode JSON from '%s'. Check for syntax errors.", path)
         raise
 
-# Load config once at module import to be used by other components.
-try:
-    config = load_config()
-except Exception:
-    # Fallback to default config if loading fails, allowing the program to potentially run.
-    logger.warning("Failed to load config.json at %s. Using default in-memory configuration.", CONFIG_PATH)
-    config = Config({
-        "hotkey": {
-            "modifiers": ["ctrl", "alt", "shift"],
-            "base_keys": [f"f{i}" for i in range(1, 12)]  # F1-F11
-        },
-        "poll_interval": 0.5,
-        "debounce_seconds": 0.5,
-        "poll_move_threshold": 1.0,
-        "debug": False,
-        "preferred_backends": ["evdev_uinput", "pynput", "simulate"],
-        "server_port": 9876,
-        "server_bind": "0.0.0.0"
-    })
\ No newline at end of file
+@functools.lru_cache(maxsize=1)
+def get_config() -> Config:
+    """
+    Returns the application configuration, loading it on first use.
+
+    The file is read and parsed only once; subsequent calls return the cached
+    Config object.
+    """
+    try:
+        return load_config()
+    except Exception:
+        # Fallback to default config if loading fails, allowing the program to potentially run.
+        logger.warning("Failed to load config.json at %s. Using default in-memory configuration.", CONFIG_PATH)
+        return Config.from_dict({
+            "hotkey": {
+                "modifiers": ["ctrl", "alt", "shift"],
+                "base_keys": [f"f{i}" for i in range(1, 12)]  # F1-F11
+            },
+            "poll_interval": 0.5,
+            "debounce_seconds": 0.5,
+            "poll_move_threshold": 1.0,
+            "debug": False,
+            "preferred_backends": ["evdev_uinput", "pynput", "simulate"],
+            "server_port": 9876,
+            "server_bind": "0.0.0.0",
+            "enable_sunshine_mapping": True
+        })
\ No newline at end of file
@@ -0,0 +1,106 @@
+"""Minimal client for Hyprland's IPC sockets.
+
+Talking to the compositor socket directly avoids forking a `hyprctl` process
+for every query. Hyprland answers one request per connection and then closes
+it, so each request opens a fresh (cheap) Unix socket connection.
+"""
+import os
+import shutil
+import socket
+import subprocess
+import logging
+from typing import Optional
+
+
+logger = logging.getLogger(__name__)
+
+# Request/reply socket and event socket names inside the instance directory
+REQUEST_SOCKET = '.socket.sock'
+EVENT_SOCKET = '.socket2.sock'
+
+# hyprctl resolved once at import so the subprocess fallback does not search
+# PATH on every call; the bare name keeps the FileNotFoundError behaviour
+HYPRCTL = shutil.which('hyprctl') or 'hyprctl'
+
+
+def run_hyprctl(*args: str, timeout: float = 1.0) -> bytes:
+    """Run `hyprctl` with the given arguments and return its stdout.
+
+    Fallback for when the request socket cannot be used.
+
+    Args:
+        *args: hyprctl arguments, e.g. 'cursorpos' or 'monitors', '-j'.
+        timeout: Seconds to wait for hyprctl to finish.
+
+    Returns:
+        The raw stdout bytes.
+
+    Raises:
+        FileNotFoundError: If hyprctl is not installed.
+        subprocess.TimeoutExpired: If hyprctl does not finish in time.
+        subprocess.CalledProcessError: If hyprctl exits with an error.
+    """
+    result = subprocess.run(
+        [HYPRCTL, *args],
+        capture_output=True,
+        timeout=timeout,
+        check=True,
+        close_fds=False  # lets subprocess use posix_spawn instead of fork+exec
+    )
+    return result.stdout
+
+
+def get_socket_path(socket_name: str = REQUEST_SOCKET) -> Optional[str]:
+    """Resolve the path of a Hyprland IPC socket for the current instance.
+
+    Newer Hyprland versions place sockets under $XDG_RUNTIME_DIR/hypr, older
+    ones under /tmp/hypr.
+
+    Args:
+        socket_name: Socket file name (REQUEST_SOCKET or EVENT_SOCKET).
+
+    Returns:
+        The socket path if it exists, otherwise None.
+    """
+    signature = os.environ.get('HYPRLAND_INSTANCE_SIGNATURE')
+    if not signature:
+        return None
+
+    candidates = []
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR')
+    if runtime_dir:
+        candidates.append(os.path.join(runtime_dir, 'hypr', signature, socket_name))
+    candidates.append(os.path.join('/tmp', 'hypr', signature, socket_name))
+
+    for path in candidates:
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def request(path: str, command: bytes, timeout: float = 1.0) -> bytes:
+    """Send a single command to Hyprland's request socket and return the reply.
+
+    Args:
+        path: Path to the request socket (see get_socket_path).
+        command: Command as hyprctl would send it, e.g. b'cursorpos' or
+            b'j/monitors' for JSON output.
+        timeout: Seconds to wait for connect and reply.
+
+    Returns:
+        The raw reply bytes.
+
+    Raises:
+        OSError: If the socket cannot be reached or the request fails.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(path)
+        sock.sendall(command)
+        chunks = []
+        while True:
+            chunk = sock.recv(8192)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    return b''.join(chunks)
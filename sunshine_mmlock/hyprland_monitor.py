@@ -2,7 +2,13 @@
 import subprocess
 import json
 import logging
-from typing import Optional, List, Dict, Any
+import socket
+import sys
+import threading
+from bisect import bisect_right
+from operator import attrgetter
+from typing import Optional, List, Dict, Any, Tuple
+from .hyprland_ipc import EVENT_SOCKET, get_socket_path, request, run_hyprctl
 
 
 logger = logging.getLogger(__name__)
@@ -12,7 +18,8 @@ class HyprlandMonitor:
     """Represents a monitor as reported by Hyprland."""
     def __init__(self, data: Dict[str, Any]):
         self.id = data.get('id', -1)
-        self.name = data.get('name', 'unknown')
+        # Interned: used as a key into the Sunshine name -> index map
+        self.name = sys.intern(data.get('name', 'unknown'))
         self.x = data.get('x', 0)
         self.y = data.get('y', 0)
         self.width = data.get('width', 0)
@@ -23,6 +30,9 @@ class HyprlandMonitor:
         # Calculate effective dimensions (scaled dimensions used in coordinate space)
         self.effective_width = int(self.width / self.scale)
         self.effective_height = int(self.height / self.scale)
+        # Exclusive right/bottom edges, precomputed for point lookups
+        self.x_end = self.x + self.effective_width
+        self.y_end = self.y + self.effective_height
     
     def contains_point(self, x: int, y: int) -> bool:
         """Check if the given point is within this monitor's bounds.
@@ -30,41 +40,127 @@ class HyprlandMonitor:
         Uses effective (scaled) dimensions for bounds checking since Hyprland's
         coordinate system uses scaled coordinates.
         """
-        return (self.x <= x < self.x + self.effective_width and 
-                self.y <= y < self.y + self.effective_height)
+        return self.x <= x < self.x_end and self.y <= y < self.y_end
     
     def __repr__(self):
         return f"HyprlandMonitor(id={self.id}, name={self.name}, x={self.x}, y={self.y}, {self.width}x{self.height}, scale={self.scale}, effective={self.effective_width}x{self.effective_height})"
 
 
-def get_hyprland_monitors() -> List[HyprlandMonitor]:
-    """Get list of monitors from Hyprland.
+def _fetch_hyprland_monitors() -> List[HyprlandMonitor]:
+    """Query Hyprland for the current monitor list, sorted by x-coordinate.
     
-    Returns:
-        List of HyprlandMonitor objects, sorted by x-coordinate for display.
+    Uses the IPC socket when available and falls back to `hyprctl`.
     
     Raises:
-        RuntimeError: If hyprctl fails or returns unexpected format.
+        RuntimeError: If the query fails or returns unexpected format.
     """
     try:
-        result = subprocess.run(
-            ['hyprctl', 'monitors', '-j'],
-            capture_output=True,
-            text=True,
-            timeout=2.0,
-            check=True
-        )
-        monitors_data = json.loads(result.stdout)
+        socket_path = get_socket_path()
+        if socket_path is not None:
+            monitors_data = json.loads(request(socket_path, b'j/monitors', timeout=2.0))
+        else:
+            monitors_data = json.loads(run_hyprctl('monitors', '-j', timeout=2.0))
         monitors = [HyprlandMonitor(m) for m in monitors_data]
         # Sort by x-coordinate for consistent display ordering
-        monitors.sort(key=lambda m: m.x)
+        monitors.sort(key=attrgetter('x'))
         return monitors
-    except (subprocess.TimeoutExpired, subprocess.CalledProcessError, 
+    except (OSError, subprocess.TimeoutExpired, subprocess.CalledProcessError, 
             json.JSONDecodeError, KeyError) as e:
         logger.error("Failed to get monitors from hyprctl: %s", e)
         raise RuntimeError(f"hyprctl monitors query failed: {e}")
 
 
+# Monitor bounds as (x0, y0, x1, y1) with exclusive right/bottom edges
+Rect = Tuple[int, int, int, int]
+
+
+class _MonitorCache:
+    """Caches the monitor list between Hyprland monitor events.
+    
+    A daemon thread listens on Hyprland's event socket and marks the cache
+    dirty when monitors are added/removed or the config is reloaded. While
+    the event socket is not connected, every lookup refetches.
+    """
+    # Prefix match also covers the "v2" variants (e.g. monitoraddedv2)
+    INVALIDATING_EVENTS = (b'monitoradded', b'monitorremoved',
+                           b'monitorlayoutchanged', b'configreloaded')
+    
+    def __init__(self):
+        # (monitors sorted by x, their x-coordinates, their (x0, y0, x1, y1)
+        # bounds) replaced as one object so readers never see a list and
+        # index from different fetches
+        self.state: Tuple[List[HyprlandMonitor], List[int], Tuple[Rect, ...]] = ([], [], ())
+        self.dirty = True
+        self._listening = False
+        self._listener_started = False
+        self._lock = threading.Lock()
+    
+    def get(self) -> Tuple[List[HyprlandMonitor], List[int], Tuple[Rect, ...]]:
+        """Return the cached (monitors, x-coordinates, bounds), refetching if stale."""
+        if not self._listener_started:
+            self._start_listener()
+        
+        if self.dirty or not self._listening:
+            with self._lock:
+                # Clear before fetching so an event arriving mid-fetch is kept
+                self.dirty = False
+                try:
+                    monitors = _fetch_hyprland_monitors()
+                except Exception:
+                    self.dirty = True
+                    raise
+                self.state = (monitors, [m.x for m in monitors],
+                              tuple((m.x, m.y, m.x_end, m.y_end) for m in monitors))
+        return self.state
+    
+    def _start_listener(self):
+        self._listener_started = True
+        path = get_socket_path(EVENT_SOCKET)
+        if path is None:
+            logger.debug("Hyprland event socket not found, monitor list will not be cached")
+            return
+        threading.Thread(target=self._listen, args=(path,), daemon=True).start()
+    
+    def _listen(self, path: str):
+        """Read line-delimited "EVENT>>DATA" messages from the event socket."""
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.connect(path)
+                # Anything may have changed before we were subscribed
+                self.dirty = True
+                self._listening = True
+                for line in sock.makefile('rb'):
+                    if line.split(b'>>', 1)[0].startswith(self.INVALIDATING_EVENTS):
+                        logger.debug("Hyprland event %r, invalidating monitor cache", line.strip())
+                        self.dirty = True
+        except OSError as e:
+            logger.warning("Hyprland event listener stopped: %s", e)
+        finally:
+            self._listening = False
+            self.dirty = True
+
+
+_monitor_cache = _MonitorCache()
+
+# Single-entry cache of the last successful lookup: (bounds tuple, bounds, index)
+_last_hit: Optional[Tuple[Tuple[Rect, ...], Rect, int]] = None
+
+
+def get_hyprland_monitors() -> List[HyprlandMonitor]:
+    """Get list of monitors from Hyprland.
+    
+    The list is cached and only refreshed after Hyprland reports a monitor
+    change; callers must not modify it.
+    
+    Returns:
+        List of HyprlandMonitor objects, sorted by x-coordinate for display.
+    
+    Raises:
+        RuntimeError: If hyprctl fails or returns unexpected format.
+    """
+    return _monitor_cache.get()[0]
+
+
 def get_monitor_index_from_xy_hyprland(x: int, y: int) -> Optional[int]:
     """Determine which monitor contains the given coordinates using Hyprland.
     
@@ -80,12 +176,36 @@ def get_monitor_index_from_xy_hyprland(x: int, y: int) -> Optional[int]:
     Returns:
         The monitor index (sorted by x position, 0-based), or None if not found.
     """
+    global _last_hit
     try:
-        monitors = get_hyprland_monitors()
-        for index, monitor in enumerate(monitors):
-            if monitor.contains_point(x, y):
+        monitors, xs, rects = _monitor_cache.get()
+        
+        # Bounds are compared as plain tuples rather than via contains_point
+        # to avoid attribute loads and a method call per monitor.
+        # The cursor usually stays on the same monitor: test it first. The
+        # entry is only valid for the bounds tuple it was computed from.
+        if _last_hit is not None:
+            hit_rects, (x0, y0, x1, y1), hit_index = _last_hit
+            if hit_rects is rects and x0 <= x < x1 and y0 <= y < y1:
+                return hit_index
+        
+        # Monitors are sorted by x: the candidate is the last one starting at
+        # or before x. Fall back to a full scan for vertically stacked layouts.
+        index = bisect_right(xs, x) - 1
+        if index >= 0:
+            rect = rects[index]
+            x0, y0, x1, y1 = rect
+            if x0 <= x < x1 and y0 <= y < y1:
+                _last_hit = (rects, rect, index)
+                return index
+        
+        for index, rect in enumerate(rects):
+            x0, y0, x1, y1 = rect
+            if x0 <= x < x1 and y0 <= y < y1:
+                monitor = monitors[index]
                 logger.debug("Coordinate (%d, %d) is on monitor index %d (ID=%d, name=%s, x=%d)", 
                            x, y, index, monitor.id, monitor.name, monitor.x)
+                _last_hit = (rects, rect, index)
                 return index
         return None
     except Exception as e:
@@ -2,33 +2,53 @@
 import subprocess
 import logging
 from typing import Tuple, Optional
+from .hyprland_ipc import get_socket_path, request, run_hyprctl
 
 
 logger = logging.getLogger(__name__)
 
 
+def _parse_cursorpos(data: bytes) -> Tuple[int, int]:
+    """Parse a raw b"X, Y\n" cursorpos reply without decoding it.
+    
+    int() accepts bytes and ignores surrounding whitespace, so no strip or
+    text decode is needed.
+    
+    Raises:
+        ValueError: If the reply is not two comma-separated integers.
+    """
+    x, y = data.split(b',')
+    return (int(x), int(y))
+
+
 class HyprlandMouseReader:
-    """Reads mouse position directly from Hyprland compositor via hyprctl.
+    """Reads mouse position directly from Hyprland compositor.
     
     This provides accurate absolute mouse coordinates on Hyprland without
-    needing X11 or accumulating relative movements.
+    needing X11 or accumulating relative movements. Queries go straight to
+    Hyprland's IPC socket; `hyprctl` is only spawned if the socket cannot
+    be used.
     """
     
     def __init__(self):
-        """Initialize and verify hyprctl is available."""
+        """Initialize and verify the Hyprland socket or hyprctl is available."""
+        self._socket_path = get_socket_path()
+        if self._socket_path is not None:
+            try:
+                self._position_from_socket()
+                logger.info("Hyprland mouse reader initialized (IPC socket %s)", self._socket_path)
+                return
+            except RuntimeError as e:
+                logger.info("Hyprland IPC socket unusable, falling back to hyprctl: %s", e)
+                self._socket_path = None
+        
         try:
-            result = subprocess.run(
-                ['hyprctl', 'cursorpos'],
-                capture_output=True,
-                text=True,
-                timeout=1.0,
-                check=True
-            )
+            output = run_hyprctl('cursorpos', timeout=1.0)
             # Test that we can parse the output (format: "X, Y")
-            parts = result.stdout.strip().split(',')
-            if len(parts) != 2:
-                raise ValueError(f"Unexpected cursorpos format: {result.stdout}")
+            _parse_cursorpos(output)
             logger.info("Hyprland mouse reader initialized successfully")
+        except ValueError as e:
+            raise ValueError(f"Unexpected cursorpos format: {output!r}") from e
         except (subprocess.TimeoutExpired, subprocess.CalledProcessError, FileNotFoundError) as e:
             raise RuntimeError(f"hyprctl not available or not working: {e}")
     
@@ -39,22 +59,26 @@ class HyprlandMouseReader:
             Tuple of (x, y) coordinates.
         
         Raises:
-            RuntimeError: If hyprctl fails or returns unexpected format.
+            RuntimeError: If the query fails or returns unexpected format.
         """
+        if self._socket_path is not None:
+            return self._position_from_socket()
+        return self._position_from_hyprctl()
+    
+    def _position_from_socket(self) -> Tuple[int, int]:
+        """Query cursor position over Hyprland's IPC socket."""
         try:
-            result = subprocess.run(
-                ['hyprctl', 'cursorpos'],
-                capture_output=True,
-                text=True,
-                timeout=2.0,  # Increased from 0.5s to avoid spurious timeouts during high system load
-                check=True
-            )
-            # Parse "X, Y" format
-            parts = result.stdout.strip().split(',')
-            x = int(parts[0].strip())
-            y = int(parts[1].strip())
-            return (x, y)
-        except (subprocess.TimeoutExpired, subprocess.CalledProcessError, ValueError, IndexError) as e:
+            return _parse_cursorpos(request(self._socket_path, b'cursorpos'))
+        except (OSError, ValueError) as e:
+            logger.error("Failed to get cursor position from Hyprland socket: %s", e)
+            raise RuntimeError(f"Hyprland cursor position query failed: {e}")
+    
+    def _position_from_hyprctl(self) -> Tuple[int, int]:
+        """Query cursor position by running `hyprctl cursorpos`."""
+        try:
+            # Increased from 0.5s to avoid spurious timeouts during high system load
+            return _parse_cursorpos(run_hyprctl('cursorpos', timeout=2.0))
+        except (subprocess.TimeoutExpired, subprocess.CalledProcessError, ValueError) as e:
             logger.error("Failed to get cursor position from hyprctl: %s", e)
             raise RuntimeError(f"hyprctl cursor position query failed: {e}")
 
@@ -62,16 +86,10 @@ class HyprlandMouseReader:
 def is_hyprland_available() -> bool:
     """Check if we're running under Hyprland compositor.
     
+    Looks for the instance signature and IPC socket Hyprland exports instead
+    of spawning `hyprctl version`; hyprctl itself needs the same socket.
+    
     Returns:
-        True if Hyprland is available and hyprctl works.
+        True if Hyprland's IPC socket is reachable on disk.
     """
-    try:
-        result = subprocess.run(
-            ['hyprctl', 'version'],
-            capture_output=True,
-            timeout=1.0,
-            check=True
-        )
-        return True
-    except Exception:
-        return False
+    return get_socket_path() is not None
@@ -1,3 +1,4 @@
+import os
 import threading
 import logging
 from typing import Optional, Tuple
@@ -10,6 +11,51 @@ except Exception:
     ecodes = None
 
 
+# Remembers the selected device across runs so startup can skip the scan
+_DEVICE_CACHE_FILE = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'),
+    'sunshine_mmlock', 'evdev_device')
+
+
+def _read_cached_device_path() -> Optional[str]:
+    """Return the device path saved by a previous run, if any."""
+    try:
+        with open(_DEVICE_CACHE_FILE) as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+
+def _write_cached_device_path(path: str):
+    """Save the selected device path; failures only cost a rescan next time."""
+    try:
+        os.makedirs(os.path.dirname(_DEVICE_CACHE_FILE), exist_ok=True)
+        with open(_DEVICE_CACHE_FILE, 'w') as f:
+            f.write(path)
+    except OSError as e:
+        logging.getLogger(__name__).debug("Could not cache evdev device path: %s", e)
+
+
+def _open_mouse_device(path: str):
+    """Open path and return the InputDevice if it reports relative X/Y motion.
+
+    Devices that do not qualify are closed immediately rather than left for
+    the garbage collector.
+    """
+    try:
+        dev = InputDevice(path)
+    except Exception:
+        return None
+    try:
+        rel = dev.capabilities().get(ecodes.EV_REL, ())
+        if ecodes.REL_X in rel and ecodes.REL_Y in rel:
+            return dev
+    except Exception:
+        pass
+    dev.close()
+    return None
+
+
 class EvdevMouseReader:
     """Reads relative mouse movements from an evdev device and accumulates
     an approximate absolute position. This is a best-effort fallback when
@@ -25,30 +71,36 @@ class EvdevMouseReader:
         self._device = None
         self._running = False
         self._thread: Optional[threading.Thread] = None
-        self.x = 0
-        self.y = 0
+        # Set whenever relative motion arrives; lets consumers sleep while idle
+        self._motion = threading.Event()
+        # Position as a single tuple so readers never see a half-applied update
+        self._xy: Tuple[int, int] = (0, 0)
 
         if InputDevice is None:
             raise RuntimeError("evdev not available")
 
+        # Try the device chosen on a previous run before scanning /dev/input
+        cached_path = _read_cached_device_path()
+        if cached_path is not None:
+            self._device = _open_mouse_device(cached_path)
+
         # find a suitable device with relative X/Y
-        for path in list_devices():
-            try:
-                dev = InputDevice(path)
-                caps = dev.capabilities()
-                if ecodes.EV_REL in caps and ecodes.REL_X in caps[ecodes.EV_REL] and ecodes.REL_Y in caps[ecodes.EV_REL]:
-                    self._device = dev
-                    self.logger.info("Evdev mouse reader using %s (%s)", dev.path, dev.name)
+        if self._device is None:
+            for path in list_devices():
+                if path == cached_path:
+                    continue
+                self._device = _open_mouse_device(path)
+                if self._device is not None:
+                    _write_cached_device_path(path)
                     break
-            except Exception:
-                continue
 
         if self._device is None:
             raise RuntimeError("No evdev mouse device found or permission denied")
+        self.logger.info("Evdev mouse reader using %s (%s)", self._device.path, self._device.name)
 
     def start(self, initial: Optional[Tuple[int, int]] = None):
         if initial is not None:
-            self.x, self.y = initial
+            self._xy = (int(initial[0]), int(initial[1]))
         self._running = True
         self._thread = threading.Thread(target=self._run, daemon=True)
         self._thread.start()
@@ -59,17 +111,34 @@ class EvdevMouseReader:
             self._thread.join(timeout=1.0)
 
     def _run(self):
+        EV_REL, EV_SYN = ecodes.EV_REL, ecodes.EV_SYN
+        REL_X, REL_Y = ecodes.REL_X, ecodes.REL_Y
+        SYN_REPORT = ecodes.SYN_REPORT
+        dx = dy = 0
         try:
             for event in self._device.read_loop():
                 if not self._running:
                     break
-                if event.type == ecodes.EV_REL:
-                    if event.code == ecodes.REL_X:
-                        self.x += event.value
-                    elif event.code == ecodes.REL_Y:
-                        self.y += event.value
+                etype = event.type
+                if etype == EV_REL:
+                    if event.code == REL_X:
+                        dx += event.value
+                    elif event.code == REL_Y:
+                        dy += event.value
+                elif etype == EV_SYN and event.code == SYN_REPORT and (dx or dy):
+                    # SYN_REPORT closes a packet: apply its accumulated motion at once
+                    x, y = self._xy
+                    self._xy = (x + dx, y + dy)
+                    dx = dy = 0
+                    self._motion.set()
         except Exception as e:
             self.logger.exception("Evdev mouse reader stopped: %s", e)
 
     def position(self) -> Tuple[int, int]:
-        return int(self.x), int(self.y)
+        return self._xy
+
+    def wait_for_motion(self, timeout: Optional[float] = None) -> bool:
+        """Block until the mouse moves (or timeout). Returns True on motion."""
+        moved = self._motion.wait(timeout)
+        self._motion.clear()
+        return moved
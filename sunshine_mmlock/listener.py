@@ -1,9 +1,10 @@
 import logging
+import threading
 import time
 from typing import Callable, Optional, Tuple
 from .mapper import get_monitor_from_xy, get_monitor_from_xy_sunshine
 from .executor import KeystrokeExecutor
-from .config import config
+from .config import get_config
 
 
 class MousePoller:
@@ -15,16 +16,23 @@ class MousePoller:
     def __init__(self, executor: Optional[KeystrokeExecutor] = None,
                  mouse_position_provider: Optional[Callable[[], Tuple[int, int]]] = None,
                  use_sunshine_mapping: bool = True):
+        config = get_config()
         self._executor = executor if executor is not None else KeystrokeExecutor()
         self._last_monitor_index: int = -1
         self._last_position: Optional[Tuple[int, int]] = None
+        # Last position exactly as returned by the provider, significant or not
+        self._last_raw_position: Optional[Tuple[int, int]] = None
         # Use a dedicated poll interval and a separate debounce interval
         self._poll_interval: float = float(config.poll_interval)
         self._debounce_seconds: float = float(config.debounce_seconds)
         self._debug = config.debug
         self._move_threshold: float = float(config.poll_move_threshold)
+        self._move_threshold_sq: float = self._move_threshold * self._move_threshold
         self._use_sunshine_mapping = use_sunshine_mapping
-        self._running = False
+        # Set by stop(); waits on it return immediately instead of sleeping out the interval
+        self._stop_event = threading.Event()
+        # Set when the evdev fallback reader is used; it can signal motion
+        self._evdev_reader = None
         # Resolve a mouse position provider if not supplied. 
         # Priority: injected > Hyprland native > mouseinfo > pynput > evdev fallback
         if mouse_position_provider is not None:
@@ -101,7 +109,7 @@ class MousePoller:
     def start(self):
         """Starts the polling loop and blocks until interrupted."""
         logging.info("Starting mouse poller with a %.3f second poll interval...", self._poll_interval)
-        self._running = True
+        self._stop_event.clear()
 
         # Get initial position
         try:
@@ -110,63 +118,97 @@ class MousePoller:
                 self._last_monitor_index = get_monitor_from_xy_sunshine(x, y)
             else:
                 self._last_monitor_index = get_monitor_from_xy(x, y)
-            self._last_position = (x, y)
+            self._last_position = self._last_raw_position = (x, y)
             logging.info("Started on monitor: %s at (%s, %s)", self._last_monitor_index, x, y)
         except Exception as e:
             logging.error("Could not determine initial mouse position: %s", e, exc_info=True)
             self._last_monitor_index = -1
-            self._last_position = None
+            self._last_position = self._last_raw_position = None
 
         last_switch_time = 0.0
-
-        while self._running:
+        # Hot-loop lookups bound to locals; none of these change while running
+        provider = self._mouse_position_provider
+        map_fn = get_monitor_from_xy_sunshine if self._use_sunshine_mapping else get_monitor_from_xy
+        executor = self._executor
+        debounce = self._debounce_seconds
+        thr_sq = self._move_threshold_sq
+        debug = self._debug
+        wait_for_next_poll = self._wait_for_next_poll
+        stopped = self._stop_event.is_set
+        monotonic = time.monotonic
+        last_position = self._last_position
+        last_raw_position = self._last_raw_position
+        last_monitor_index = self._last_monitor_index
+
+        while not stopped():
             try:
-                x, y = self._mouse_position_provider()
+                position = provider()
 
-                # Determine which monitor (if any) the current coordinates map to.
-                if self._use_sunshine_mapping:
-                    monitor_index = get_monitor_from_xy_sunshine(x, y)
-                else:
-                    monitor_index = get_monitor_from_xy(x, y)
+                # An idle mouse reports the same coordinates: nothing to do.
+                if position == last_raw_position:
+                    wait_for_next_poll()
+                    continue
+                last_raw_position = self._last_raw_position = position
+                x, y = position
 
-                if self._debug:
-                    logging.debug("Polling mouse at: (%s, %s) -> monitor: %s", x, y, monitor_index if monitor_index is not None else 'unknown')
                 # Movement threshold: ignore tiny/irrelevant motion to reduce noise.
-                if self._last_position is not None:
-                    dx = x - self._last_position[0]
-                    dy = y - self._last_position[1]
+                # Checked before the monitor lookup, whose result would be unused.
+                if last_position is not None:
+                    dx = x - last_position[0]
+                    dy = y - last_position[1]
                     dist_sq = dx * dx + dy * dy
-                    if dist_sq < (self._move_threshold * self._move_threshold):
+                    if dist_sq < thr_sq:
                         # Uncomment the lines below if you like noisy debug logs!
-                        #if self._debug:
+                        #if debug:
                             #logging.debug("Ignored small mouse movement (dx=%s, dy=%s, thr=%s)", dx, dy, self._move_threshold)
-                        time.sleep(self._poll_interval)
+                        wait_for_next_poll()
                         continue
 
                 # Update last_position only when movement is significant
-                self._last_position = (x, y)
+                last_position = self._last_position = (x, y)
+
+                # Determine which monitor (if any) the current coordinates map to.
+                monitor_index = map_fn(x, y)
+
+                if debug:
+                    logging.debug("Polling mouse at: (%s, %s) -> monitor: %s", x, y, monitor_index if monitor_index is not None else 'unknown')
 
-                now = time.time()
+                # Monotonic clock: debounce must not be affected by wall-clock jumps
+                now = monotonic()
                 if monitor_index is None:
                     # Position doesn't map to known monitors — do not spam logs; handled silently unless debug needs it.
                     pass
-                elif monitor_index != self._last_monitor_index and (now - last_switch_time) >= self._debounce_seconds:
-                    logging.info("Monitor switch: %s -> %s at (%s, %s) (debounce=%.2fs)", self._last_monitor_index, monitor_index, x, y, self._debounce_seconds)
+                elif monitor_index != last_monitor_index and (now - last_switch_time) >= debounce:
+                    logging.info("Monitor switch: %s -> %s at (%s, %s) (debounce=%.2fs)", last_monitor_index, monitor_index, x, y, debounce)
                     try:
-                        self._executor.execute_for_monitor(monitor_index)
+                        executor.execute_for_monitor(monitor_index)
                     except Exception:
                         logging.exception("Executor failed to execute hotkey for monitor %s", monitor_index)
-                    self._last_monitor_index = monitor_index
+                    last_monitor_index = self._last_monitor_index = monitor_index
                     last_switch_time = now
 
-                time.sleep(self._poll_interval)
+                wait_for_next_poll()
 
             except Exception as e:
                 logging.error("An error occurred during polling: %s", e, exc_info=True)
                 # Wait a bit longer before retrying to avoid spamming errors
-                time.sleep(1)
+                self._stop_event.wait(1)
+
+    def _wait_for_next_poll(self):
+        """Sleeps for the poll interval before the next position read.
+
+        With the evdev reader, positions only change on kernel input events,
+        so after the interval we stay idle until the mouse actually moves
+        instead of re-reading an unchanged position.
+        """
+        if self._stop_event.wait(self._poll_interval):
+            return
+        if self._evdev_reader is not None:
+            # Wake at least once a second to notice stop()
+            while not self._stop_event.is_set() and not self._evdev_reader.wait_for_motion(1.0):
+                pass
 
     def stop(self):
         """Stops the mouse poller."""
         logging.info("Stopping mouse poller...")
-        self._running = False
\ No newline at end of file
+        self._stop_event.set()
\ No newline at end of file
@@ -1,6 +1,8 @@
-from typing import Optional, Dict
+from typing import Optional, Dict, Tuple
 import logging
 import time
+from bisect import bisect_right
+from operator import attrgetter
 
 logger = logging.getLogger(__name__)
 
@@ -9,6 +11,73 @@ _sunshine_monitor_map: Optional[Dict[str, int]] = None
 _last_refresh_time: float = 0.0
 _refresh_cooldown: float = 10.0  # Minimum seconds between refreshes
 
+# Monitor names a refresh could not find, with the monotonic time of that
+# refresh. Lookups on them return None without re-parsing the logs until
+# _missing_retry has passed or the mapping changes.
+_missing_names: Dict[str, float] = {}
+_missing_retry: float = 60.0
+
+# Short-lived copy of the Hyprland monitor list so bursts of lookups at
+# mouse-move rate share one IPC round-trip
+_hypr_monitors_cache = None
+_hypr_monitors_ts: float = 0.0
+_HYPR_TTL: float = 0.5  # seconds
+
+# Bounds (x0, y0, x1, y1) and Sunshine index of the last resolved monitor.
+# Only trusted while the monitor list above is fresh; cleared when it changes.
+_last_bbox: Optional[Tuple[int, int, int, int]] = None
+_last_sunshine_idx: Optional[int] = None
+
+# Hyprland lookups, bound on first use so the per-call import statement is skipped
+_get_hypr_monitors = None
+_get_hypr_xy = None
+
+# screeninfo module once imported; False if the import failed
+_screeninfo = None
+
+
+def invalidate_hyprland_cache():
+    """Forces the next Sunshine lookup to re-query Hyprland's monitor list."""
+    global _hypr_monitors_cache, _hypr_monitors_ts, _last_bbox
+    _hypr_monitors_cache = None
+    _hypr_monitors_ts = 0.0
+    _last_bbox = None
+
+
+def _get_cached_hyprland_monitors():
+    """Returns (monitors, x-coordinates, overlapping) for Hyprland's monitor list.
+
+    The list is re-queried at most every _HYPR_TTL seconds. Monitors come
+    sorted by x; `overlapping` is True when any two share an x-range (e.g.
+    vertically stacked), in which case a binary search on x is not enough.
+    """
+    global _hypr_monitors_cache, _hypr_monitors_ts, _last_bbox, _get_hypr_monitors
+    now = time.monotonic()
+    if _hypr_monitors_cache is None or now - _hypr_monitors_ts > _HYPR_TTL:
+        if _get_hypr_monitors is None:
+            from .hyprland_monitor import get_hyprland_monitors as _get_hypr_monitors
+        _last_bbox = None
+        monitors = _get_hypr_monitors()
+        overlapping = any(a.x_end > b.x for a, b in zip(monitors, monitors[1:]))
+        _hypr_monitors_cache = (monitors, [m.x for m in monitors], overlapping)
+        _hypr_monitors_ts = now
+    return _hypr_monitors_cache
+
+
+def _find_hyprland_monitor(x: int, y: int):
+    """Returns the Hyprland monitor containing (x, y), or None."""
+    monitors, xs, overlapping = _get_cached_hyprland_monitors()
+    if not overlapping:
+        # Disjoint x-ranges: the only candidate is the last monitor starting at or before x
+        index = bisect_right(xs, x) - 1
+        if index >= 0 and monitors[index].contains_point(x, y):
+            return monitors[index]
+        return None
+    for monitor in monitors:
+        if monitor.contains_point(x, y):
+            return monitor
+    return None
+
 
 def initialize_sunshine_mapping() -> bool:
     """Initialize the Sunshine monitor mapping from logs.
@@ -28,14 +97,14 @@ def initialize_sunshine_mapping() -> bool:
         if _sunshine_monitor_map:
             logger.info("Sunshine monitor mapping initialized:")
             for name, idx in _sunshine_monitor_map.items():
-                logger.info(f"  {name} → Sunshine Monitor {idx} (F{idx + 1})")
+                logger.info("  %s → Sunshine Monitor %d (F%d)", name, idx, idx + 1)
             return True
         else:
             logger.warning("No monitors found in Sunshine logs")
             return False
             
     except Exception as e:
-        logger.error(f"Failed to initialize Sunshine mapping: {e}", exc_info=True)
+        logger.error("Failed to initialize Sunshine mapping: %s", e, exc_info=True)
         return False
 
 
@@ -53,24 +122,28 @@ def refresh_sunshine_mapping() -> bool:
     # Check cooldown
     now = time.time()
     if now - _last_refresh_time < _refresh_cooldown:
-        logger.debug(f"Skipping refresh (cooldown: {_refresh_cooldown}s)")
+        logger.debug("Skipping refresh (cooldown: %ss)", _refresh_cooldown)
         return False
     
     try:
         from .sunshine_monitor import create_sunshine_monitor_map
-        old_map = _sunshine_monitor_map.copy() if _sunshine_monitor_map else {}
+        # The new map is a fresh dict, so the old one can be kept by reference
+        old_map = _sunshine_monitor_map or {}
         _sunshine_monitor_map = create_sunshine_monitor_map()
         _last_refresh_time = now
+        # A new Sunshine mapping usually follows a monitor change
+        invalidate_hyprland_cache()
         
         if _sunshine_monitor_map:
             # Check if anything changed
             if old_map != _sunshine_monitor_map:
+                _missing_names.clear()
                 logger.info("Sunshine monitor mapping refreshed:")
                 for name, idx in _sunshine_monitor_map.items():
                     if name not in old_map:
-                        logger.info(f"  NEW: {name} → Sunshine Monitor {idx} (F{idx + 1})")
+                        logger.info("  NEW: %s → Sunshine Monitor %d (F%d)", name, idx, idx + 1)
                     else:
-                        logger.debug(f"  {name} → Sunshine Monitor {idx} (F{idx + 1})")
+                        logger.debug("  %s → Sunshine Monitor %d (F%d)", name, idx, idx + 1)
             else:
                 logger.debug("Sunshine mapping unchanged after refresh")
             return True
@@ -79,10 +152,31 @@ def refresh_sunshine_mapping() -> bool:
             return False
             
     except Exception as e:
-        logger.error(f"Failed to refresh Sunshine mapping: {e}", exc_info=True)
+        logger.error("Failed to refresh Sunshine mapping: %s", e, exc_info=True)
         return False
 
 
+def _import_screeninfo():
+    """Imports screeninfo on first use and remembers the outcome.
+    
+    Without this, a missing screeninfo would be searched for on every lookup.
+    
+    Raises:
+        ImportError: If screeninfo is not installed.
+    """
+    global _screeninfo
+    if _screeninfo is None:
+        try:
+            import screeninfo
+            _screeninfo = screeninfo
+        except ImportError:
+            _screeninfo = False
+            raise
+    if _screeninfo is False:
+        raise ImportError("screeninfo is not installed")
+    return _screeninfo
+
+
 def get_monitor_from_xy_sunshine(x: int, y: int) -> Optional[int]:
     """
     Determines which monitor contains the given coordinates and returns Sunshine's monitor index.
@@ -96,44 +190,62 @@ def get_monitor_from_xy_sunshine(x: int, y: int) -> Optional[int]:
     Returns:
         The Sunshine monitor index (0-based), or None if not found.
     """
-    global _sunshine_monitor_map
+    global _sunshine_monitor_map, _last_bbox, _last_sunshine_idx
     
     # If no Sunshine mapping is available, fall back to position-based
     if _sunshine_monitor_map is None:
         logger.debug("Sunshine mapping not initialized, falling back to position-based")
         return get_monitor_from_xy(x, y)
     
+    # Consecutive lookups are almost always on the same monitor
+    bbox = _last_bbox
+    if (bbox is not None and bbox[0] <= x < bbox[2] and bbox[1] <= y < bbox[3]
+            and time.monotonic() - _hypr_monitors_ts <= _HYPR_TTL):
+        return _last_sunshine_idx
+    
     # Get the monitor name from Hyprland
     try:
-        from .hyprland_monitor import get_hyprland_monitors
-        monitors = get_hyprland_monitors()
-        
         # Find which monitor contains this point
-        for monitor in monitors:
-            if monitor.contains_point(x, y):
-                # Look up the Sunshine index for this monitor name
-                sunshine_index = _sunshine_monitor_map.get(monitor.name)
-                if sunshine_index is not None:
-                    logger.debug(f"Coordinate ({x}, {y}) on {monitor.name} → Sunshine index {sunshine_index}")
-                    return sunshine_index
-                else:
-                    # Monitor not in mapping - try refreshing once
-                    logger.warning(f"Monitor {monitor.name} not found in Sunshine mapping, refreshing...")
-                    if refresh_sunshine_mapping():
-                        # Try lookup again after refresh
-                        sunshine_index = _sunshine_monitor_map.get(monitor.name)
-                        if sunshine_index is not None:
-                            logger.info(f"Found {monitor.name} after refresh → Sunshine index {sunshine_index}")
-                            return sunshine_index
-                    
-                    logger.warning(f"Monitor {monitor.name} still not found after refresh")
-                    return None
+        monitor = _find_hyprland_monitor(x, y)
+        if monitor is None:
+            # Not on any monitor
+            return None
         
-        # Not on any monitor
+        # Look up the Sunshine index for this monitor name; hits dominate, so
+        # subscript directly and handle the miss as the exception
+        try:
+            sunshine_index = _sunshine_monitor_map[monitor.name]
+        except KeyError:
+            pass
+        else:
+            logger.debug("Coordinate (%d, %d) on %s → Sunshine index %d", x, y, monitor.name, sunshine_index)
+            _last_sunshine_idx = sunshine_index
+            _last_bbox = (monitor.x, monitor.y, monitor.x_end, monitor.y_end)
+            return sunshine_index
+        
+        # Known to be missing: don't re-parse the logs on every mouse move
+        missing_since = _missing_names.get(monitor.name)
+        if missing_since is not None and time.monotonic() - missing_since < _missing_retry:
+            return None
+        
+        # Monitor not in mapping - try refreshing once
+        logger.warning("Monitor %s not found in Sunshine mapping, refreshing...", monitor.name)
+        if refresh_sunshine_mapping():
+            # Try lookup again after refresh
+            try:
+                sunshine_index = _sunshine_monitor_map[monitor.name]
+            except KeyError:
+                pass
+            else:
+                logger.info("Found %s after refresh → Sunshine index %d", monitor.name, sunshine_index)
+                return sunshine_index
+        
+        logger.warning("Monitor %s still not found after refresh", monitor.name)
+        _missing_names[monitor.name] = time.monotonic()
         return None
         
     except Exception as e:
-        logger.error(f"Failed to get monitor from coordinates: {e}", exc_info=True)
+        logger.error("Failed to get monitor from coordinates: %s", e, exc_info=True)
         return None
 
 
@@ -155,20 +267,22 @@ def get_monitor_from_xy(x: int, y: int) -> Optional[int]:
     Returns:
         The index of the monitor (sorted by x position), or None if not found.
     """
+    global _get_hypr_xy
     # Try Hyprland first (most accurate on Hyprland/Wayland)
     try:
-        from .hyprland_monitor import get_monitor_index_from_xy_hyprland
-        return get_monitor_index_from_xy_hyprland(x, y)
+        if _get_hypr_xy is None:
+            from .hyprland_monitor import get_monitor_index_from_xy_hyprland as _get_hypr_xy
+        return _get_hypr_xy(x, y)
     except Exception as e_hyprland:
         # Fall back to screeninfo for X11 or other display servers
         try:
             # Import screeninfo lazily so the module can still import on systems
             # where screeninfo is not installed; callers will get None if we
             # can't detect monitors.
-            import screeninfo
+            screeninfo = _import_screeninfo()
 
             # Sort monitors by their x-coordinate to ensure a consistent order (0, 1, 2, etc.)
-            monitors = sorted(screeninfo.get_monitors(), key=lambda m: m.x)
+            monitors = sorted(screeninfo.get_monitors(), key=attrgetter('x'))
             for i, monitor in enumerate(monitors):
                 if monitor.x <= x < monitor.x + monitor.width and \
                    monitor.y <= y < monitor.y + monitor.height:
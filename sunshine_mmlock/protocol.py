@@ -7,8 +7,8 @@ Simple TCP-based protocol where:
 - Connection is persistent with reconnection logic
 """
 
+import os
 import socket
-import struct
 import logging
 
 logger = logging.getLogger(__name__)
@@ -19,6 +19,30 @@ PROTOCOL_VERSION = 1
 DEFAULT_PORT = 9876
 MAX_MONITOR_ID = 10  # Support F1-F11
 
+# Valid monitor IDs and their pre-encoded single-byte messages
+_VALID_IDS = frozenset(range(MAX_MONITOR_ID + 1))
+_ENCODED = tuple(bytes((i,)) for i in range(MAX_MONITOR_ID + 1))
+
+
+def configure_socket(sock: socket.socket):
+    """Apply low-latency options to a connected TCP socket.
+    
+    Messages are single bytes that must be delivered immediately, so Nagle's
+    algorithm is disabled (there is nothing to coalesce). Keepalive lets a
+    dead peer be detected on an otherwise idle connection.
+    
+    Args:
+        sock: Connected TCP socket
+    """
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    # Linux only: acknowledge immediately instead of delaying ACKs
+    if hasattr(socket, 'TCP_QUICKACK'):
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+        except OSError:
+            pass
+
 
 class MonitorProtocol:
     """Handles encoding/decoding of monitor switch messages."""
@@ -33,11 +57,11 @@ class MonitorProtocol:
         Returns:
             Bytes ready to send over the network
         """
-        if not (0 <= monitor_id <= MAX_MONITOR_ID):
+        if monitor_id not in _VALID_IDS:
             raise ValueError(f"Monitor ID must be 0-{MAX_MONITOR_ID}, got {monitor_id}")
         
         # Simple protocol: single byte for monitor ID
-        return struct.pack('B', monitor_id)
+        return _ENCODED[monitor_id]
     
     @staticmethod
     def decode_monitor_switch(data: bytes) -> int:
@@ -52,9 +76,9 @@ class MonitorProtocol:
         if len(data) != 1:
             raise ValueError(f"Expected 1 byte, got {len(data)}")
         
-        monitor_id = struct.unpack('B', data)[0]
+        monitor_id = data[0]
         
-        if not (0 <= monitor_id <= MAX_MONITOR_ID):
+        if monitor_id not in _VALID_IDS:
             raise ValueError(f"Invalid monitor ID: {monitor_id}")
         
         return monitor_id
@@ -109,3 +133,60 @@ def receive_monitor_switch(sock: socket.socket, timeout: float = None) -> int:
         raise TimeoutError("Receive timeout")
     except (socket.error, OSError) as e:
         raise ConnectionError(f"Socket error: {e}")
+
+
+def receive_monitor_switch_fd(fd: int) -> int:
+    """Receive a monitor switch notification directly from a socket descriptor.
+    
+    Reads with os.read() on the raw file descriptor, bypassing the socket
+    object wrapper. Only valid on POSIX systems, and the socket must be in
+    blocking mode. Unlike receive_monitor_switch(), nothing is logged; the
+    caller decides whether to.
+    
+    Args:
+        fd: File descriptor of a connected, blocking socket
+        
+    Returns:
+        Monitor ID (0-10)
+        
+    Raises:
+        ConnectionError: If connection is closed
+        ValueError: If invalid data received
+    """
+    try:
+        data = os.read(fd, 1)
+    except OSError as e:
+        raise ConnectionError(f"Socket error: {e}")
+    
+    if not data:
+        raise ConnectionError("Connection closed by peer")
+    
+    return MonitorProtocol.decode_monitor_switch(data)
+
+
+def receive_monitor_switch_into(sock: socket.socket, buf: bytearray) -> int:
+    """Receive a monitor switch notification into a caller-owned buffer.
+    
+    Uses recv_into() so no new bytes object is allocated per message.
+    Nothing is logged; the caller decides whether to.
+    
+    Args:
+        sock: Connected socket
+        buf: Reusable buffer of length 1
+        
+    Returns:
+        Monitor ID (0-10)
+        
+    Raises:
+        ConnectionError: If connection is closed
+        ValueError: If invalid data received
+    """
+    try:
+        n = sock.recv_into(buf, 1)
+    except (socket.error, OSError) as e:
+        raise ConnectionError(f"Socket error: {e}")
+    
+    if n == 0:
+        raise ConnectionError("Connection closed by peer")
+    
+    return MonitorProtocol.decode_monitor_switch(buf)
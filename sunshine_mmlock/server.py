@@ -5,11 +5,12 @@ This server monitors mouse position and sends monitor ID updates to connected cl
 """
 
 import logging
+import selectors
 import socket
 import threading
 import time
-from typing import Set, Optional
-from .protocol import send_monitor_switch, DEFAULT_PORT
+from typing import List, Optional
+from .protocol import MonitorProtocol, send_monitor_switch, configure_socket, DEFAULT_PORT
 
 
 logger = logging.getLogger(__name__)
@@ -28,10 +29,15 @@ class MonitorServer:
         self.port = port
         self.bind_address = bind_address
         self._server_socket: Optional[socket.socket] = None
-        self._clients: Set[socket.socket] = set()
+        # A list rather than a set: it is iterated on every broadcast and
+        # holds only a handful of clients, so O(n) removal is irrelevant
+        self._clients: List[socket.socket] = []
         self._clients_lock = threading.Lock()
         self._running = False
         self._accept_thread: Optional[threading.Thread] = None
+        self._selector: Optional[selectors.BaseSelector] = None
+        self._wakeup_r: Optional[socket.socket] = None
+        self._wakeup_w: Optional[socket.socket] = None
         self._current_monitor: Optional[int] = None
     
     def start(self):
@@ -45,6 +51,16 @@ class MonitorServer:
             self._server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
             self._server_socket.bind((self.bind_address, self.port))
             self._server_socket.listen(5)
+            self._server_socket.setblocking(False)
+            
+            # The accept thread sleeps in select() on the listening socket and
+            # a wakeup socket pair; stop() writes to the pair to end it at once.
+            self._selector = selectors.DefaultSelector()
+            self._wakeup_r, self._wakeup_w = socket.socketpair()
+            self._wakeup_r.setblocking(False)
+            self._wakeup_w.setblocking(False)
+            self._selector.register(self._server_socket, selectors.EVENT_READ)
+            self._selector.register(self._wakeup_r, selectors.EVENT_READ)
             self._running = True
             
             logger.info("Server listening on %s:%d", self.bind_address, self.port)
@@ -56,9 +72,7 @@ class MonitorServer:
         except (socket.error, OSError) as e:
             logger.error("Failed to start server: %s", e)
             self._running = False
-            if self._server_socket:
-                self._server_socket.close()
-                self._server_socket = None
+            self._close_listener()
             raise
     
     def stop(self):
@@ -66,53 +80,91 @@ class MonitorServer:
         logger.info("Stopping server...")
         self._running = False
         
-        # Close server socket
-        if self._server_socket:
+        # Wake the accept thread and wait for it before closing what it selects on
+        if self._wakeup_w is not None:
             try:
-                self._server_socket.close()
-            except Exception:
+                self._wakeup_w.send(b'\0')
+            except OSError:
                 pass
-            self._server_socket = None
+        if self._accept_thread and self._accept_thread.is_alive():
+            self._accept_thread.join(timeout=2.0)
+        
+        # Close server socket
+        self._close_listener()
         
         # Close all client connections
         with self._clients_lock:
-            for client in list(self._clients):
+            while self._clients:
+                client = self._clients.pop()
                 try:
                     client.close()
                 except Exception:
                     pass
-            self._clients.clear()
-        
-        # Wait for accept thread to finish
-        if self._accept_thread and self._accept_thread.is_alive():
-            self._accept_thread.join(timeout=2.0)
+    
+    def _close_listener(self):
+        """Close the listening socket, selector and wakeup sockets."""
+        if self._selector is not None:
+            self._selector.close()
+            self._selector = None
+        for sock in (self._server_socket, self._wakeup_r, self._wakeup_w):
+            if sock is not None:
+                try:
+                    sock.close()
+                except Exception:
+                    pass
+        self._server_socket = self._wakeup_r = self._wakeup_w = None
     
     def _accept_connections(self):
         """Accept incoming client connections (runs in separate thread)."""
-        while self._running and self._server_socket:
+        selector = self._selector
+        server_socket = self._server_socket
+        while self._running:
             try:
-                self._server_socket.settimeout(1.0)
-                client_socket, address = self._server_socket.accept()
-                
-                logger.info("Client connected from %s:%d", address[0], address[1])
-                
-                with self._clients_lock:
-                    self._clients.add(client_socket)
-                
-                # Send current monitor state immediately to new client
-                if self._current_monitor is not None:
-                    if not send_monitor_switch(client_socket, self._current_monitor):
-                        logger.warning("Failed to send initial monitor state to new client")
-                        client_socket.close()
-                        with self._clients_lock:
-                            self._clients.discard(client_socket)
-                
-            except socket.timeout:
-                continue
-            except (socket.error, OSError) as e:
+                events = selector.select()
+            except (OSError, ValueError) as e:
                 if self._running:
-                    logger.error("Error accepting connection: %s", e)
+                    logger.error("Error waiting for connections: %s", e)
                 break
+            
+            for key, _ in events:
+                if key.fileobj is self._wakeup_r:
+                    try:
+                        self._wakeup_r.recv(64)
+                    except OSError:
+                        pass
+                    continue
+                
+                try:
+                    client_socket, address = server_socket.accept()
+                except BlockingIOError:
+                    # Connection went away between select() and accept()
+                    continue
+                except (socket.error, OSError) as e:
+                    if self._running:
+                        logger.error("Error accepting connection: %s", e)
+                    return
+                self._add_client(client_socket, address)
+    
+    def _add_client(self, client_socket: socket.socket, address):
+        """Configure a newly accepted client and send it the current monitor."""
+        configure_socket(client_socket)
+        # Broadcasts must never wait on a slow client (see broadcast_monitor_switch)
+        client_socket.setblocking(False)
+        
+        logger.info("Client connected from %s:%d", address[0], address[1])
+        
+        with self._clients_lock:
+            self._clients.append(client_socket)
+        
+        # Send current monitor state immediately to new client
+        if self._current_monitor is not None:
+            if not send_monitor_switch(client_socket, self._current_monitor):
+                logger.warning("Failed to send initial monitor state to new client")
+                client_socket.close()
+                with self._clients_lock:
+                    # A failed broadcast may have removed it already
+                    if client_socket in self._clients:
+                        self._clients.remove(client_socket)
     
     def broadcast_monitor_switch(self, monitor_id: int):
         """Send a monitor switch notification to all connected clients.
@@ -120,26 +172,45 @@ class MonitorServer:
         Args:
             monitor_id: Monitor ID (0-10)
         """
+        # Clients already know the current monitor (new ones get it on
+        # connect), so repeating it would only add sends
+        if monitor_id == self._current_monitor:
+            return
         self._current_monitor = monitor_id
+        message = MonitorProtocol.encode_monitor_switch(monitor_id)
         
+        removed = 0
         with self._clients_lock:
-            disconnected = []
+            # Only allocated when a send fails, which is rare
+            disconnected = None
             
+            # Client sockets are non-blocking. A one-byte message only fails to
+            # fit when the client has stopped reading entirely (BlockingIOError),
+            # so it is dropped like a broken connection instead of stalling the
+            # other clients and the mouse poller.
             for client in self._clients:
-                if not send_monitor_switch(client, monitor_id):
+                try:
+                    client.send(message)
+                except OSError as e:
+                    logger.debug("Send to client failed: %s", e)
+                    if disconnected is None:
+                        disconnected = []
                     disconnected.append(client)
+            logger.debug("Sent monitor ID %d to %d client(s)", monitor_id, len(self._clients))
             
             # Remove disconnected clients
-            for client in disconnected:
+            while disconnected:
+                client = disconnected.pop()
                 try:
                     client.close()
                 except Exception:
                     pass
-                self._clients.discard(client)
+                self._clients.remove(client)
+                removed += 1
                 logger.info("Client disconnected (send failed)")
         
-        if disconnected:
-            logger.debug("Removed %d disconnected clients", len(disconnected))
+        if removed:
+            logger.debug("Removed %d disconnected clients", removed)
     
     def get_client_count(self) -> int:
         """Get the number of connected clients."""
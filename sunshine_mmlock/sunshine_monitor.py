@@ -1,12 +1,23 @@
 """Parse Sunshine logs to extract monitor mappings."""
 import re
+import sys
 import logging
-import subprocess
+import threading
+from operator import attrgetter
 from typing import List, Dict, Optional
 from pathlib import Path
-logging.basicConfig(level=logging.DEBUG)
+
 logger = logging.getLogger(__name__)
 
+# Monitor list lines, e.g. "Monitor 0 is HDMI-A-1: XXX Projector (HDMI-A-1)"
+_MONITOR_RE = re.compile(r'Monitor (\d+) is (.*):(.*)$')
+# The log-file parser matches connector-style names (DP-1, HDMI-A-1, SUNSHINE)
+_LOG_MONITOR_RE = re.compile(r'Monitor (\d+) is ([A-Z]+-?[A-Z]*-?\d*|[A-Z]+):(.*)$')
+_SECTION_START = '-------- Start of Wayland monitor list --------'
+_SECTION_END = '--------- End of Wayland monitor list ---------'
+# How much of the end of the Sunshine log file to scan for a monitor list
+_LOG_TAIL_BYTES = 256 * 1024
+
 
 class SunshineMonitor:
     """Represents a monitor as reported by Sunshine."""
@@ -19,14 +30,23 @@ class SunshineMonitor:
         return f"SunshineMonitor(index={self.index}, name={self.name}, description={self.description})"
 
 
+# Log file found by find_sunshine_log_file; cleared if it disappears
+_log_file_path: Optional[Path] = None
+
+
 def find_sunshine_log_file() -> Optional[Path]:
     """Find Sunshine's log file.
     
-    Checks common locations for Sunshine logs.
+    Checks common locations for Sunshine logs. A found path is remembered
+    and returned by later calls without probing the filesystem again.
     
     Returns:
         Path to the log file, or None if not found.
     """
+    global _log_file_path
+    if _log_file_path is not None:
+        return _log_file_path
+    
     possible_locations = [
         Path.home() / ".local" / "share" / "sunshine" / "sunshine.log",
         Path.home() / ".config" / "sunshine" / "sunshine.log",
@@ -37,12 +57,49 @@ def find_sunshine_log_file() -> Optional[Path]:
     for path in possible_locations:
         if path.exists():
             logger.debug(f"Found Sunshine log at: {path}")
+            _log_file_path = path
             return path
     
     logger.warning("Could not find Sunshine log file in common locations")
     return None
 
 
+def _last_monitor_section(content: str) -> Optional[str]:
+    """Return the body of the last complete monitor list section in content.
+    
+    Returns:
+        The text between the start and end markers, stripped, or None if no
+        complete section is present.
+    """
+    end = content.rfind(_SECTION_END)
+    if end == -1:
+        return None
+    start = content.rfind(_SECTION_START, 0, end)
+    if start == -1:
+        return None
+    return content[start + len(_SECTION_START):end].strip()
+
+
+def _read_last_monitor_section(log_path: Path) -> Optional[str]:
+    """Return the last complete monitor list section in a Sunshine log file.
+    
+    Only the most recent section matters: scan the tail of the log and read
+    the whole file only if the tail holds no complete section.
+    
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    with open(log_path, 'rb') as f:
+        f.seek(0, 2)
+        size = f.tell()
+        f.seek(max(0, size - _LOG_TAIL_BYTES))
+        monitor_section = _last_monitor_section(f.read().decode('utf-8', errors='replace'))
+        if monitor_section is None and size > _LOG_TAIL_BYTES:
+            f.seek(0)
+            monitor_section = _last_monitor_section(f.read().decode('utf-8', errors='replace'))
+    return monitor_section
+
+
 def parse_sunshine_monitors_from_journalctl() -> List[SunshineMonitor]:
     """Parse Sunshine's monitor list from journalctl output.
     
@@ -54,48 +111,78 @@ def parse_sunshine_monitors_from_journalctl() -> List[SunshineMonitor]:
     Returns:
         List of SunshineMonitor objects in the order Sunshine reports them.
     """
+    # Only needed here, and only once at startup or on refresh
+    import subprocess
+    
     try:
-        # Get recent journal entries
-        result = subprocess.run(
-            ['journalctl', '-xe', '--no-pager', '-n', '1000'],
-            capture_output=True,
+        # Stream recent journal entries instead of buffering the whole dump;
+        # stderr is discarded as capture_output did
+        cmd = ['journalctl', '-xe', '--no-pager', '-n', '1000']
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             text=True,
-            timeout=5.0
+            errors='replace'  # one bad byte must not discard the whole list
         )
+        # Reading the pipe has no timeout of its own: kill a hung journalctl
+        timed_out = threading.Event()
         
-        if result.returncode != 0:
-            logger.error("Failed to run journalctl")
-            return []
+        def _kill():
+            timed_out.set()
+            proc.kill()
         
-        content = result.stdout
+        watchdog = threading.Timer(5.0, _kill)
+        watchdog.start()
+        try:
+            # Keep only the lines of the most recent section: restart on each
+            # start marker, keep the collected lines on the end marker
+            section_lines = None
+            current = None
+            for line in proc.stdout:
+                if _SECTION_START in line:
+                    current = []
+                elif current is not None:
+                    if _SECTION_END in line:
+                        section_lines = current
+                        current = None
+                    else:
+                        current.append(line)
+            returncode = proc.wait(timeout=5.0)
+        finally:
+            watchdog.cancel()
+            if proc.poll() is None:
+                proc.kill()
+            proc.stdout.close()
+            proc.wait()
         
-        # Find all monitor list sections and take the most recent one
-        # Split by the start marker
-        sections = content.split('-------- Start of Wayland monitor list --------')
-        
-        if len(sections) < 2:
-            logger.warning("No Wayland monitor list found in journalctl output")
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(cmd, 5.0)
+        if returncode != 0:
+            logger.error("Failed to run journalctl")
             return []
         
-        # Get the last section and find the end marker
-        last_section = sections[-1]
-        if '--------- End of Wayland monitor list ---------' not in last_section:
+        if current is not None:
+            # The newest section is unterminated; don't fall back to an older one
             logger.warning("Monitor list end marker not found")
             return []
+        if section_lines is None:
+            logger.warning("No Wayland monitor list found in journalctl output")
+            return []
         
-        # Extract just the monitor list content
-        monitor_section = last_section.split('--------- End of Wayland monitor list ---------')[0]
-        print(monitor_section)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Sunshine monitor list section: %s", ''.join(section_lines))
         # Parse monitor lines
         # Expected formats:
         # "Monitor 0 is HDMI-A-1: XXX Projector (HDMI-A-1)"
         # "Monitor 2 is SUNSHINE:"  (virtual display with no description)
         monitors = []
-        monitor_pattern = r'Monitor (\d+) is (.*):(.*)$'
         
-        for line in monitor_section.split('\n'):
-            match = re.search(monitor_pattern, line)
-            print(match)
+        for line in section_lines:
+            # Cheap substring test before running the regex
+            if 'Monitor ' not in line:
+                continue
+            match = _MONITOR_RE.search(line.rstrip('\n'))
             if match:
                 index = int(match.group(1))
                 name = match.group(2).strip()
@@ -109,7 +196,7 @@ def parse_sunshine_monitors_from_journalctl() -> List[SunshineMonitor]:
                 logger.debug(f"Parsed Sunshine monitor {index}: {name} - {description}")
         
         # Sort by index to ensure correct order
-        monitors.sort(key=lambda m: m.index)
+        monitors.sort(key=attrgetter('index'))
         
         logger.info(f"Parsed {len(monitors)} monitor(s) from Sunshine (journalctl)")
         return monitors
@@ -133,13 +220,16 @@ def parse_sunshine_monitors(log_path: Optional[Path] = None) -> List[SunshineMon
     Returns:
         List of SunshineMonitor objects in the order Sunshine reports them.
     """
+    global _log_file_path
+    
     # Try journalctl first (most up-to-date)
     monitors = parse_sunshine_monitors_from_journalctl()
     if monitors:
         return monitors
     
     # Fallback to log file if provided
-    if log_path is None:
+    searched = log_path is None
+    if searched:
         log_path = find_sunshine_log_file()
     
     if log_path is None:
@@ -147,26 +237,31 @@ def parse_sunshine_monitors(log_path: Optional[Path] = None) -> List[SunshineMon
         return []
     
     try:
-        with open(log_path, 'r') as f:
-            content = f.read()
-        
-        # Find the most recent monitor list section
-        pattern = r'-------- Start of Wayland monitor list --------\s*(.*?)\s*--------- End of Wayland monitor list ---------'
-        matches = re.findall(pattern, content, re.DOTALL)
+        try:
+            monitor_section = _read_last_monitor_section(log_path)
+        except FileNotFoundError:
+            if not searched:
+                raise
+            # The remembered log file is gone: forget it and probe again
+            _log_file_path = None
+            log_path = find_sunshine_log_file()
+            if log_path is None:
+                logger.error("Cannot parse Sunshine monitors: journalctl failed and no log file found")
+                return []
+            monitor_section = _read_last_monitor_section(log_path)
         
-        if not matches:
+        if monitor_section is None:
             logger.warning("No Wayland monitor list found in Sunshine log file")
             return []
         
-        # Use the last (most recent) match
-        monitor_section = matches[-1]
-        
         # Parse monitor lines with the same pattern
         monitors = []
-        monitor_pattern = r'Monitor (\d+) is ([A-Z]+-?[A-Z]*-?\d*|[A-Z]+):(.*)$'
         
-        for line in monitor_section.split('\n'):
-            match = re.search(monitor_pattern, line)
+        for line in monitor_section.splitlines():
+            # Cheap substring test before running the regex
+            if 'Monitor ' not in line:
+                continue
+            match = _LOG_MONITOR_RE.search(line)
             if match:
                 index = int(match.group(1))
                 name = match.group(2).strip()
@@ -179,7 +274,7 @@ def parse_sunshine_monitors(log_path: Optional[Path] = None) -> List[SunshineMon
                 ))
                 logger.debug(f"Parsed Sunshine monitor {index}: {name}")
         
-        monitors.sort(key=lambda m: m.index)
+        monitors.sort(key=attrgetter('index'))
         logger.info(f"Parsed {len(monitors)} monitor(s) from Sunshine log file")
         return monitors
         
@@ -193,9 +288,10 @@ def create_sunshine_monitor_map() -> Dict[str, int]:
     
     Returns:
         Dict mapping monitor name (e.g., "DP-1") to Sunshine monitor index (0, 1, 2...).
+        Names are interned, as are Hyprland's, so lookups match by identity.
     """
     monitors = parse_sunshine_monitors()
-    return {mon.name: mon.index for mon in monitors}
+    return {sys.intern(mon.name): mon.index for mon in monitors}
 
 
 def get_sunshine_monitor_index(monitor_name: str, sunshine_map: Optional[Dict[str, int]] = None) -> Optional[int]:
@@ -1,35 +1,128 @@
 #!/usr/bin/env python3
 """Quick script to debug monitor detection."""
 
-import screeninfo
-
-monitors = screeninfo.get_monitors()
-print(f"Total monitors detected: {len(monitors)}\n")
-
-for i, m in enumerate(monitors):
-    print(f"Monitor {i} (unsorted): {m.name}")
-    print(f"  Position: ({m.x}, {m.y})")
-    print(f"  Size: {m.width}x{m.height}")
-    print(f"  Bounds: x=[{m.x}, {m.x + m.width}), y=[{m.y}, {m.y + m.height})")
-    print()
-
-# Now show sorted order (how mapper.py sees them)
-monitors_sorted = sorted(monitors, key=lambda m: m.x)
-print("\n=== After sorting by x-coordinate (mapper.py order) ===\n")
-for i, m in enumerate(monitors_sorted):
-    print(f"Monitor {i}: {m.name}")
-    print(f"  Position: ({m.x}, {m.y})")
-    print(f"  Size: {m.width}x{m.height}")
-    print(f"  Bounds: x=[{m.x}, {m.x + m.width}), y=[{m.y}, {m.y + m.height})")
-    print()
-
-# Test some coordinates
-test_coords = [(1280, 720), (2686, 508), (6438, 866)]
-print("\n=== Testing coordinate mappings ===")
-for x, y in test_coords:
-    for i, m in enumerate(monitors_sorted):
-        if m.x <= x < m.x + m.width and m.y <= y < m.y + m.height:
-            print(f"({x}, {y}) -> Monitor {i}")
-            break
-    else:
-        print(f"({x}, {y}) -> NOT FOUND")
+import sys
+from array import array
+from operator import attrgetter
+
+# One monitor's report block, filled with a single %-format per monitor
+_MONITOR_TMPL = ("Monitor %d%s: %s\n"
+                 "  Position: (%d, %d)\n"
+                 "  Size: %dx%d\n"
+                 "  Bounds: x=[%d, %d), y=[%d, %d)\n\n")
+
+
+def make_lookup(bounds):
+    """Generate an exact point-in-monitor lookup specialized to one layout.
+
+    bounds holds (x0, y0, x1, y1, index) tuples with exclusive right/bottom
+    edges, the same containment rule mapper.py applies to every mouse event.
+    They become constants in a straight-line chain of comparisons, so there is
+    no loop or tuple unpacking per call. The returned lookup(x, y) gives the
+    index of the first monitor containing (x, y), or None.
+    """
+    lines = ["def lookup(x, y):"]
+    for x0, y0, x1, y1, i in bounds:
+        # int() so only numbers can ever reach the generated source
+        lines.append(f"    if {int(x0)} <= x < {int(x1)} and {int(y0)} <= y < {int(y1)}: return {int(i)}")
+    lines.append("    return None")
+    namespace = {}
+    exec("\n".join(lines), namespace)
+    return namespace["lookup"]
+
+
+def build_grid(bounds, target_cells=256):
+    """Build a coarse tile index over the monitor layout.
+
+    The layout is covered by square tiles of 2**shift pixels, roughly
+    target_cells tiles along the longer side. A tile lying entirely inside
+    one monitor stores that monitor's index; tiles on a monitor edge or
+    outside every monitor store -1 and need an exact check. Tiles are kept in
+    an array('h'), about 2 bytes each.
+
+    Returns:
+        (x_min, y_min, x_max, y_max, shift, cols, tiles), or None if bounds
+        is empty.
+    """
+    if not bounds:
+        return None
+    x_min = min(b[0] for b in bounds)
+    y_min = min(b[1] for b in bounds)
+    x_max = max(b[2] for b in bounds)
+    y_max = max(b[3] for b in bounds)
+    shift = max(0, ((max(x_max - x_min, y_max - y_min) // target_cells).bit_length() - 1))
+    size = 1 << shift
+    cols = ((x_max - x_min - 1) >> shift) + 1
+    rows = ((y_max - y_min - 1) >> shift) + 1
+    # Packed 2-byte signed ints rather than a list of int objects; -2 marks a
+    # tile no monitor has touched yet
+    tiles = array('h', [-2]) * (cols * rows)
+    # Painted in order: a tile takes monitor i only if no earlier monitor
+    # touches it, so as with the exact scan the first of any overlapping
+    # (e.g. mirrored) monitors wins. Partly covered tiles get -1.
+    for x0, y0, x1, y1, i in bounds:
+        # Tiles fully covered by this monitor
+        c0 = -(-(x0 - x_min) // size)
+        r0 = -(-(y0 - y_min) // size)
+        c1 = (x1 - x_min) // size
+        r1 = (y1 - y_min) // size
+        # Tiles this monitor touches at all
+        for r in range((y0 - y_min) // size, -(-(y1 - y_min) // size)):
+            full_row = r0 <= r < r1
+            for t in range(r * cols + (x0 - x_min) // size, r * cols - (-(x1 - x_min) // size)):
+                if tiles[t] == -2:
+                    tiles[t] = i if full_row and c0 <= t - r * cols < c1 else -1
+    for t, v in enumerate(tiles):
+        if v == -2:
+            tiles[t] = -1
+    return x_min, y_min, x_max, y_max, shift, cols, tiles
+
+
+def main():
+    # Imported here: screeninfo probes the display server on import
+    import screeninfo
+
+    monitors = screeninfo.get_monitors()
+    # Each section is collected and written in one call rather than a print per line
+    out = [f"Total monitors detected: {len(monitors)}\n\n"]
+
+    # The raw detection order is only interesting when debugging screeninfo
+    if "--verbose" in sys.argv[1:]:
+        for i, m in enumerate(monitors):
+            out.append(_MONITOR_TMPL % (i, " (unsorted)", m.name, m.x, m.y, m.width, m.height,
+                                        m.x, m.x + m.width, m.y, m.y + m.height))
+    sys.stdout.write(''.join(out))
+
+    # Now show sorted order (how mapper.py sees them), with each monitor's
+    # bounds computed once as (x0, y0, x1, y1, index)
+    monitors_sorted = sorted(monitors, key=attrgetter("x"))
+    bounds = tuple((m.x, m.y, m.x + m.width, m.y + m.height, i) for i, m in enumerate(monitors_sorted))
+    out = ["\n=== After sorting by x-coordinate (mapper.py order) ===\n\n"]
+    for m, (x0, y0, x1, y1, i) in zip(monitors_sorted, bounds):
+        out.append(_MONITOR_TMPL % (i, "", m.name, x0, y0, m.width, m.height, x0, x1, y0, y1))
+    sys.stdout.write(''.join(out))
+
+    # Test some coordinates
+    test_coords = [(1280, 720), (2686, 508), (6438, 866)]
+    out = ["\n=== Testing coordinate mappings ===\n"]
+    grid = build_grid(bounds)
+    if grid is not None:
+        gx0, gy0, gx1, gy1, shift, cols, tiles = grid
+    lookup = make_lookup(bounds)
+    for x, y in test_coords:
+        # One tile load answers most points; edge tiles fall back to a scan.
+        # With no monitors detected there is no grid and nothing is found.
+        found = None
+        if grid is not None and gx0 <= x < gx1 and gy0 <= y < gy1:
+            found = tiles[((y - gy0) >> shift) * cols + ((x - gx0) >> shift)]
+            if found < 0:
+                found = lookup(x, y)
+        if found is None:
+            out.append(f"({x}, {y}) -> NOT FOUND\n")
+        else:
+            out.append(f"({x}, {y}) -> Monitor {found}\n")
+    sys.stdout.write(''.join(out))
+
+
+if __name__ == "__main__":
+    main()
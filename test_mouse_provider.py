@@ -1,42 +1,147 @@
 #!/usr/bin/env python3
 """Test mouse position providers to see which actually works."""
 
-print("Testing mouse position providers...\n")
+import ctypes
+import functools
+from concurrent.futures import ThreadPoolExecutor
+import os
+import time
+
+
+def _connect_display(lib_name, connect, disconnect):
+    """Return whether lib_name's connect(NULL) reaches a display server.
+
+    None means the library itself could not be loaded.
+    """
+    try:
+        lib = ctypes.CDLL(lib_name)
+    except OSError:
+        return None
+    open_fn = getattr(lib, connect)
+    open_fn.restype = ctypes.c_void_p
+    open_fn.argtypes = [ctypes.c_char_p]
+    handle = open_fn(None)
+    if not handle:
+        return False
+    close_fn = getattr(lib, disconnect)
+    close_fn.argtypes = [ctypes.c_void_p]
+    close_fn(handle)
+    return True
+
+
+@functools.lru_cache(maxsize=None)
+def detect_display() -> str:
+    """Return 'wayland', 'x11' or 'tty' for the current session.
+
+    Actually connecting through libwayland-client / libX11 answers which
+    server is reachable. Without those libraries the display variables the
+    session exports decide; XDG_SESSION_TYPE alone is unreliable (often
+    unset or stale inside nested sessions).
+    """
+    wayland = _connect_display("libwayland-client.so.0", "wl_display_connect", "wl_display_disconnect")
+    if wayland:
+        return "wayland"
+    x11 = _connect_display("libX11.so.6", "XOpenDisplay", "XCloseDisplay")
+    if x11:
+        return "x11"
+    if wayland is not None and x11 is not None:
+        # Both libraries loaded but neither server answered
+        return "tty"
 
-# Test 1: mouseinfo
-print("1. Testing mouseinfo...")
-try:
+    env = os.environ
+    session_type = env.get("XDG_SESSION_TYPE", "")
+    wayland_display = env.get("WAYLAND_DISPLAY", "")
+    display = env.get("DISPLAY", "")
+    if "wayland" in session_type or (wayland_display and "x11" not in session_type):
+        return "wayland"
+    if display:
+        return "x11"
+    return "tty"
+
+
+def _try_mouseinfo():
     import mouseinfo
-    pos = mouseinfo.position()
-    print(f"   ✓ mouseinfo works: {pos}\n")
-    mouseinfo_works = True
-except Exception as e:
-    print(f"   ✗ mouseinfo failed: {e}\n")
-    mouseinfo_works = False
-
-# Test 2: pynput
-print("2. Testing pynput...")
-try:
+    mouseinfo.position()  # raises if it cannot actually read the position
+    return mouseinfo.position
+
+
+def _try_pynput():
     from pynput.mouse import Controller
     c = Controller()
-    pos = c.position
-    print(f"   ✓ pynput works: {pos}\n")
-    pynput_works = True
-except Exception as e:
-    print(f"   ✗ pynput failed: {e}\n")
-    pynput_works = False
-
-# Test 3: Check display environment
-print("3. Display environment:")
-import os
-print(f"   DISPLAY={os.environ.get('DISPLAY', 'not set')}")
-print(f"   WAYLAND_DISPLAY={os.environ.get('WAYLAND_DISPLAY', 'not set')}")
-print(f"   XDG_SESSION_TYPE={os.environ.get('XDG_SESSION_TYPE', 'not set')}")
-
-print("\n" + "="*50)
-if mouseinfo_works or pynput_works:
-    print("✓ At least one reliable method available!")
-    print("  The app should NOT be using EvdevMouseReader.")
-else:
-    print("✗ No high-level mouse position API available.")
-    print("  App will use EvdevMouseReader (which has drift issues).")
+    c.position  # raises if it cannot actually read the position
+    return lambda: c.position
+
+
+# Providers in the order the app prefers them
+PROVIDERS = {
+    "mouseinfo": _try_mouseinfo,
+    "pynput": _try_pynput,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def probe(name: str):
+    """Try a provider once. Returns (position callable, None) or (None, error)."""
+    try:
+        return PROVIDERS[name](), None
+    except Exception as e:
+        return None, e
+
+
+@functools.lru_cache(maxsize=None)
+def get_provider():
+    """Return (name, position callable) for the first working provider, or None.
+
+    Providers are probed concurrently (their imports and first reads mostly
+    wait on the display server), then picked in preference order.
+    """
+    with ThreadPoolExecutor(len(PROVIDERS)) as ex:
+        results = list(ex.map(probe, PROVIDERS))
+    for name, (position, _) in zip(PROVIDERS, results):
+        if position is not None:
+            return name, position
+    return None
+
+
+def bench(fn, n: int = 100) -> float:
+    """Return the mean wall time of fn() in nanoseconds over n calls."""
+    t0 = time.perf_counter_ns()
+    for _ in range(n):
+        fn()
+    return (time.perf_counter_ns() - t0) / n
+
+
+def main():
+    print("Testing mouse position providers...\n")
+
+    # Tests 1-2: providers in preference order, all probed up front in parallel
+    selected = get_provider()
+    for n, name in enumerate(PROVIDERS, 1):
+        print(f"{n}. Testing {name}...")
+        # Cached: get_provider() already probed it
+        position, error = probe(name)
+        if position is not None:
+            print(f"   ✓ {name} works: {position()}")
+            print(f"     {bench(position) / 1000:.1f} µs per call\n")
+        else:
+            print(f"   ✗ {name} failed: {error}\n")
+
+    # Test 3: Check display environment
+    env = os.environ
+    print("3. Display environment:\n"
+          f"   Detected session: {detect_display()}\n"
+          f"   DISPLAY={env.get('DISPLAY', 'not set')}\n"
+          f"   WAYLAND_DISPLAY={env.get('WAYLAND_DISPLAY', 'not set')}\n"
+          f"   XDG_SESSION_TYPE={env.get('XDG_SESSION_TYPE', 'not set')}")
+
+    print("\n" + "="*50)
+    if selected is not None:
+        print("✓ At least one reliable method available!")
+        print("  The app should NOT be using EvdevMouseReader.")
+    else:
+        print("✗ No high-level mouse position API available.")
+        print("  App will use EvdevMouseReader (which has drift issues).")
+
+
+if __name__ == "__main__":
+    main()